@@ -1,6 +1,53 @@
-import argparse
+import operator
 from typing import Tuple
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for the batch API
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # Fall back to the plain Python kernel
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+def _divide(num1: float, num2: float) -> float:
+    if num2 == 0:
+        raise ValueError('Cannot divide by zero')
+    return num1 / num2
+
+_OPS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': _divide,
+}
+
+_OP_CODES = {'+': 0, '-': 1, '*': 2, '/': 3}
+
+@njit(cache=True)
+def _perform_operation_nb(num1: float, num2: float, code: int) -> float:
+    """
+    Kernel for perform_operation keyed by integer op code.
+
+    Compiled with Numba when available so it can be called from other
+    jitted loops without boxing; otherwise runs as plain Python.
+
+    :param code: Operation code from _OP_CODES
+    """
+    if code == 0:
+        return num1 + num2
+    elif code == 1:
+        return num1 - num2
+    elif code == 2:
+        return num1 * num2
+    if num2 == 0.0:
+        raise ValueError('Cannot divide by zero')
+    return num1 / num2
+
 def perform_operation(num1: float, num2: float, operation: str) -> float:
     """
     Perform arithmetic operations between two numbers.
@@ -10,25 +57,57 @@ def perform_operation(num1: float, num2: float, operation: str) -> float:
     :param operation: Operation to perform ('+', '-', '*', '/')
     :return: Result of the operation
     """
-    if operation == '+':
-        return num1 + num2
-    elif operation == '-':
-        return num1 - num2
-    elif operation == '*':
-        return num1 * num2
-    elif operation == '/':
-        if num2 != 0:
-            return num1 / num2
-        else:
-            raise ValueError('Cannot divide by zero')
+    try:
+        op = _OPS[operation]
+    except KeyError:
+        raise ValueError(f'Unknown operation: {operation}') from None
+    return op(num1, num2)
+
+_UFUNCS = {
+    '+': 'add',
+    '-': 'subtract',
+    '*': 'multiply',
+    '/': 'true_divide',
+}
+
+def perform_operation_array(a, b, operation: str):
+    """
+    Apply an arithmetic operation element-wise to two arrays.
+
+    :param a: First operand (array-like)
+    :param b: Second operand (array-like, broadcastable against a)
+    :param operation: Operation to perform ('+', '-', '*', '/')
+    :return: NumPy array with the result of the operation
+    """
+    if np is None:
+        raise ImportError('perform_operation_array requires numpy')
+    try:
+        ufunc = getattr(np, _UFUNCS[operation])
+    except KeyError:
+        raise ValueError(f'Unknown operation: {operation}') from None
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if operation == '/' and not b.all():
+        raise ValueError('Cannot divide by zero')
+    return ufunc(a, b)
+
+_PARSER = None
+
+def _build_parser():
+    import argparse
 
-def main():
     parser = argparse.ArgumentParser(description='Simple Python CLI Calculator')
     parser.add_argument('num1', type=float, help='First number')
-    parser.add_argument('operation', choices=['+', '-', '*', '/'], help='Operation to perform')
+    parser.add_argument('operation', choices=list(_OPS), help='Operation to perform')
     parser.add_argument('num2', type=float, help='Second number')
+    return parser
+
+def main(argv=None):
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
 
-    args = parser.parse_args()
+    args = _PARSER.parse_args(argv)
 
     try:
         result = perform_operation(args.num1, args.num2, args.operation)
@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 import unittest
-from calculator import perform_operation
+from calculator import _OP_CODES, _perform_operation_nb, np, perform_operation, perform_operation_array
 
 class TestCalculator(unittest.TestCase):
     def test_addition(self):
@@ -20,5 +20,33 @@ class TestCalculator(unittest.TestCase):
             perform_operation(5.0, 0.0, '/')
         self.assertEqual(str(context.exception), 'Cannot divide by zero')
 
+    def test_unknown_operation(self):
+        with self.assertRaises(ValueError):
+            perform_operation(1.0, 2.0, '%')
+
+class TestCalculatorKernel(unittest.TestCase):
+    def test_matches_perform_operation(self):
+        for op, code in _OP_CODES.items():
+            self.assertEqual(_perform_operation_nb(6.0, 3.0, code), perform_operation(6.0, 3.0, op))
+
+    def test_division_fail_zero(self):
+        with self.assertRaises(ValueError):
+            _perform_operation_nb(5.0, 0.0, _OP_CODES['/'])
+
+@unittest.skipIf(np is None, 'numpy not installed')
+class TestCalculatorArray(unittest.TestCase):
+    def test_addition(self):
+        result = perform_operation_array(np.array([1.0, 2.0]), np.array([3.0, 4.0]), '+')
+        self.assertEqual(result.tolist(), [4.0, 6.0])
+
+    def test_division_broadcast(self):
+        result = perform_operation_array(np.array([8.0, 4.0]), 2.0, '/')
+        self.assertEqual(result.tolist(), [4.0, 2.0])
+
+    def test_division_fail_zero(self):
+        with self.assertRaises(ValueError) as context:
+            perform_operation_array(np.array([1.0, 2.0]), np.array([1.0, 0.0]), '/')
+        self.assertEqual(str(context.exception), 'Cannot divide by zero')
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,17 +1,23 @@
 """Agent definitions for AEGIS."""
 
-from lloyd.agents.analyst import AnalystAgent
-from lloyd.agents.architect import ArchitectAgent
-from lloyd.agents.base import AgentConfig, BaseAgent
-from lloyd.agents.coder import CoderAgent
-from lloyd.agents.researcher import ResearcherAgent
-from lloyd.agents.reviewer import ReviewerAgent
-from lloyd.agents.tester import TesterAgent
-from lloyd.agents.writer import WriterAgent
+from lloyd.agents.base import AgentConfig, BaseAgent, run_parallel
+from lloyd.agents.registry import (
+    AGENT_CONFIGS,
+    AnalystAgent,
+    ArchitectAgent,
+    CoderAgent,
+    ResearcherAgent,
+    ReviewerAgent,
+    SpecializedAgent,
+    TesterAgent,
+    WriterAgent,
+)
 
 __all__ = [
+    "AGENT_CONFIGS",
     "AgentConfig",
     "BaseAgent",
+    "SpecializedAgent",
     "AnalystAgent",
     "ArchitectAgent",
     "ResearcherAgent",
@@ -19,4 +25,5 @@ __all__ = [
     "TesterAgent",
     "ReviewerAgent",
     "WriterAgent",
+    "run_parallel",
 ]
@@ -1,14 +1,29 @@
 """Base agent class for AEGIS."""
 
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
 
-from crewai import Agent
-from pydantic import BaseModel, Field
+from crewai import Agent, Crew, Task
+from pydantic import BaseModel, ConfigDict, Field
+
+from lloyd.utils.cache import SemanticCache
 
 
 class AgentConfig(BaseModel):
-    """Configuration for an AEGIS agent."""
+    """Configuration for an AEGIS agent.
+
+    Frozen so a single instance can be shared by every agent of a kind.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     role: str = Field(..., description="The agent's role title")
     goal: str = Field(..., description="The agent's primary objective")
@@ -16,6 +31,40 @@ class AgentConfig(BaseModel):
     tools: list[str] = Field(default_factory=list, description="List of tool names")
     allow_delegation: bool = Field(default=False, description="Whether agent can delegate")
     verbose: bool = Field(default=True, description="Whether to show verbose output")
+    cache_responses: bool = Field(
+        default=False,
+        description="Whether to reuse results for repeated tasks. Only for read-only "
+        "agents, since a cached result skips the tools a task would run",
+    )
+
+
+T = TypeVar("T")
+
+# Shared pool for blocking crew kickoffs, sized for the expected agent fan-out
+# so concurrent agents are not throttled by the event loop's default executor.
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("LLOYD_AGENT_WORKERS", "16")),
+    thread_name_prefix="lloyd-agent",
+)
+
+
+async def _run_in_pool(fn: Callable[..., T], *args: Any) -> T:
+    """Run a blocking callable in the shared agent thread pool.
+
+    Args:
+        fn: Callable to run.
+        *args: Positional arguments for the callable.
+
+    Returns:
+        The callable's return value.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, fn, *args)
+
+
+def _tool_sort_key(tool: Any) -> str:
+    """Sort key giving tools a stable order in the agent prompt."""
+    return str(getattr(tool, "name", type(tool).__name__))
 
 
 class BaseAgent(ABC):
@@ -23,16 +72,50 @@ class BaseAgent(ABC):
 
     Provides common functionality and interface that all specialized
     agents inherit from.
+
+    Agents configured with ``cache_responses`` cache results in two tiers:
+    an in-memory exact-match cache per agent, and an optional shared
+    ``SemanticCache`` that normalizes prompts and persists across sessions.
+    Both are keyed by the agent's role/goal/backstory so config changes
+    invalidate old entries. Caching is off by default, because a cache hit
+    returns the old text without running the task's side effects again.
     """
 
-    def __init__(self, config: AgentConfig) -> None:
+    __slots__ = (
+        "config",
+        "response_cache",
+        "_cache",
+        "_agent",
+        "_tools",
+        "_system_prefix",
+        "_cache_version",
+        "_crew",
+        "_task",
+        "_crew_lock",
+    )
+
+    RESPONSE_CACHE_TTL = 60 * 60  # 1 hour
+    RESPONSE_CACHE_MAX_ENTRIES = 128
+
+    def __init__(self, config: AgentConfig, response_cache: SemanticCache | None = None) -> None:
         """Initialize the agent with configuration.
 
         Args:
             config: Agent configuration including role, goal, backstory, etc.
+            response_cache: Optional shared cache consulted after the
+                in-memory cache misses.
         """
         self.config = config
+        self.response_cache = response_cache
+        self._cache: dict[str, tuple[float, str]] = {}
         self._agent: Agent | None = None
+        self._tools: list[Any] | None = None
+        # Stable prompt prefix shared by every task this agent runs
+        self._system_prefix = f"{config.role}\n{config.goal}\n{config.backstory}"
+        self._crew: Crew | None = None
+        self._task: Task | None = None
+        self._crew_lock = threading.Lock()
+        self._cache_version = hashlib.sha256(self._system_prefix.encode()).hexdigest()[:16]
 
     @property
     def role(self) -> str:
@@ -49,6 +132,11 @@ class BaseAgent(ABC):
         """Get the agent's backstory."""
         return self.config.backstory
 
+    @property
+    def system_prefix(self) -> str:
+        """Get the stable role/goal/backstory prompt prefix."""
+        return self._system_prefix
+
     @abstractmethod
     def get_tools(self) -> list[Any]:
         """Get the tools available to this agent.
@@ -63,6 +151,9 @@ class BaseAgent(ABC):
     def create_agent(self) -> Agent:
         """Create and return a CrewAI Agent instance.
 
+        Tools are passed in a deterministic order so the rendered system
+        prompt is byte-identical across runs and provider prompt caches hit.
+
         Returns:
             Configured CrewAI Agent.
         """
@@ -71,12 +162,104 @@ class BaseAgent(ABC):
                 role=self.config.role,
                 goal=self.config.goal,
                 backstory=self.config.backstory,
-                tools=self.get_tools(),
+                tools=sorted(self.get_tools(), key=_tool_sort_key),
                 allow_delegation=self.config.allow_delegation,
                 verbose=self.config.verbose,
             )
         return self._agent
 
+    def _kickoff(self, task_description: str) -> str:
+        """Run a task through this agent's single-agent crew.
+
+        The Crew and Task are built on first use and reused afterwards with
+        only the task description swapped, so repeated calls skip model
+        validation. The lock serializes runs that share them.
+
+        Args:
+            task_description: Description of the task to execute.
+
+        Returns:
+            Result of task execution as a string.
+        """
+        with self._crew_lock:
+            if self._crew is None or self._task is None:
+                agent = self.create_agent()
+                # Note: In CrewAI, tasks are executed through crews, not directly.
+                # This method provides a simplified interface for single-agent execution.
+                self._task = Task(
+                    description=task_description,
+                    expected_output="Detailed result of the task execution",
+                    agent=agent,
+                )
+                self._crew = Crew(
+                    agents=[agent],
+                    tasks=[self._task],
+                    verbose=self.config.verbose,
+                )
+            else:
+                self._task.description = task_description
+
+            return str(self._crew.kickoff())
+
+    def _cache_prompt(self, task_description: str, context: dict[str, Any] | None) -> str:
+        """Build the prompt text used as a cache key.
+
+        Args:
+            task_description: Description of the task.
+            context: Optional context dictionary.
+
+        Returns:
+            Task description with serialized context appended.
+        """
+        if not context:
+            return task_description
+        return f"{task_description}\n{json.dumps(context, sort_keys=True, default=str)}"
+
+    def _get_cached(self, prompt: str) -> str | None:
+        """Look up a cached result for a prompt.
+
+        Args:
+            prompt: Prompt built by ``_cache_prompt``.
+
+        Returns:
+            Cached result or None on a miss.
+        """
+        if not self.config.cache_responses:
+            return None
+
+        entry = self._cache.get(prompt)
+        if entry is not None:
+            timestamp, result = entry
+            if time.time() - timestamp <= self.RESPONSE_CACHE_TTL:
+                return result
+            del self._cache[prompt]
+
+        if self.response_cache is not None:
+            shared = self.response_cache.get(prompt, self._cache_version)
+            if shared is not None:
+                self._cache[prompt] = (time.time(), shared)
+                return shared
+
+        return None
+
+    def _set_cached(self, prompt: str, result: str) -> None:
+        """Store a result in the response caches.
+
+        Args:
+            prompt: Prompt built by ``_cache_prompt``.
+            result: Result of executing the prompt.
+        """
+        if not self.config.cache_responses:
+            return
+
+        self._cache[prompt] = (time.time(), result)
+        if len(self._cache) > self.RESPONSE_CACHE_MAX_ENTRIES:
+            # Dicts preserve insertion order - drop the oldest entry
+            del self._cache[next(iter(self._cache))]
+
+        if self.response_cache is not None:
+            self.response_cache.set(prompt, result, self._cache_version)
+
     def execute(self, task_description: str, context: dict[str, Any] | None = None) -> str:
         """Execute a task with this agent.
 
@@ -87,26 +270,68 @@ class BaseAgent(ABC):
         Returns:
             Result of task execution as a string.
         """
-        agent = self.create_agent()
-        # Note: In CrewAI, tasks are executed through crews, not directly.
-        # This method provides a simplified interface for single-agent execution.
-        from crewai import Crew, Task
-
-        task = Task(
-            description=task_description,
-            expected_output="Detailed result of the task execution",
-            agent=agent,
-        )
+        prompt = self._cache_prompt(task_description, context)
+        cached = self._get_cached(prompt)
+        if cached is not None:
+            return cached
 
-        crew = Crew(
-            agents=[agent],
-            tasks=[task],
-            verbose=self.config.verbose,
-        )
+        result = self._kickoff(task_description)
+        self._set_cached(prompt, result)
+        return result
 
-        result = crew.kickoff()
-        return str(result)
+    async def execute_async(
+        self,
+        task_description: str,
+        context: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> str:
+        """Execute a task with this agent without blocking the event loop.
+
+        Args:
+            task_description: Description of the task to execute.
+            context: Optional context dictionary with additional information.
+            timeout: Optional timeout in seconds for the whole execution.
+
+        Returns:
+            Result of task execution as a string.
+
+        Raises:
+            TimeoutError: If the execution does not finish within ``timeout``.
+        """
+        prompt = self._cache_prompt(task_description, context)
+        cached = self._get_cached(prompt)
+        if cached is not None:
+            return cached
+
+        result = await asyncio.wait_for(
+            _run_in_pool(self._kickoff, task_description), timeout=timeout
+        )
+        self._set_cached(prompt, result)
+        return result
 
     def __repr__(self) -> str:
         """String representation of the agent."""
         return f"{self.__class__.__name__}(role='{self.config.role}')"
+
+
+async def run_parallel(
+    pairs: list[tuple[BaseAgent, str]],
+    timeout: float | None = None,
+) -> list[str]:
+    """Run independent agent tasks concurrently.
+
+    Wall-clock time is bounded by the slowest task instead of the sum of
+    all tasks. Results are returned in the same order as ``pairs``. Tasks
+    given to the same agent instance still run one at a time.
+
+    Args:
+        pairs: List of (agent, task_description) tuples. Tasks must not
+            depend on each other's output.
+        timeout: Optional per-task timeout in seconds.
+
+    Returns:
+        List of task results as strings.
+    """
+    return list(
+        await asyncio.gather(*(agent.execute_async(task, timeout=timeout) for agent, task in pairs))
+    )
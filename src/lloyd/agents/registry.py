@@ -0,0 +1,156 @@
+"""Specialized agent registry for AEGIS.
+
+All specialized agents share the same behavior and differ only in their
+configuration, so they are generated from the ``AGENT_CONFIGS`` table.
+Only agents whose tools cannot change anything cache their responses.
+"""
+
+from typing import Any
+
+from lloyd.agents.base import AgentConfig, BaseAgent
+from lloyd.tools import get_tools_by_names
+
+AGENT_CONFIGS: dict[str, AgentConfig] = {
+    "analyst": AgentConfig(
+        role="Senior Requirements Analyst",
+        goal="Transform vague product ideas into precise, actionable requirements "
+        "with clear acceptance criteria",
+        backstory=(
+            "You are a seasoned product analyst who has worked at top tech companies. "
+            "You excel at asking clarifying questions, identifying edge cases, and "
+            "breaking down complex ideas into manageable pieces. You never assume—"
+            "you always verify."
+        ),
+        tools=["web_search", "file_read"],
+        allow_delegation=False,
+        verbose=True,
+        cache_responses=True,
+    ),
+    "architect": AgentConfig(
+        role="System Architect",
+        goal="Design scalable, maintainable system architectures that balance "
+        "simplicity with extensibility",
+        backstory=(
+            "You are a principal engineer with 15+ years of experience designing "
+            "systems at scale. You believe in YAGNI (You Aren't Gonna Need It) and "
+            "favor simple solutions over complex ones. You document your decisions "
+            "and their rationale."
+        ),
+        tools=["file_read", "file_write", "web_search"],
+        allow_delegation=True,
+        verbose=True,
+    ),
+    "coder": AgentConfig(
+        role="Senior Software Engineer",
+        goal="Write clean, tested, production-ready code that solves the problem at hand",
+        backstory=(
+            "You are a pragmatic engineer who values working software over perfect "
+            "abstractions. You write code that your future self will thank you for—"
+            "clear variable names, helpful comments, and comprehensive tests. "
+            "You follow TDD when appropriate."
+        ),
+        tools=["file_read", "file_write", "code_exec", "shell"],
+        allow_delegation=False,
+        verbose=True,
+    ),
+    "researcher": AgentConfig(
+        role="Technical Researcher",
+        goal="Find and synthesize relevant technical information, best practices, "
+        "and existing solutions",
+        backstory=(
+            "You are a research scientist who loves diving deep into documentation, "
+            "papers, and codebases. You separate fact from opinion and always cite "
+            "your sources. You're particularly skilled at finding non-obvious "
+            "solutions to technical problems."
+        ),
+        tools=["web_search", "github_search", "file_read"],
+        allow_delegation=False,
+        verbose=True,
+        cache_responses=True,
+    ),
+    "reviewer": AgentConfig(
+        role="Code Reviewer",
+        goal="Maintain code quality standards and catch issues before they reach production",
+        backstory=(
+            "You've reviewed thousands of PRs and have seen every anti-pattern. "
+            "You give constructive feedback that helps engineers grow. You focus "
+            "on correctness, maintainability, and security."
+        ),
+        tools=["file_read", "github"],
+        allow_delegation=False,
+        verbose=True,
+    ),
+    "tester": AgentConfig(
+        role="QA Engineer",
+        goal="Ensure code quality through comprehensive testing—unit, integration, and end-to-end",
+        backstory=(
+            "You have a knack for finding edge cases and breaking things. You "
+            "write tests that actually catch bugs, not just increase coverage "
+            "numbers. You believe tests are documentation."
+        ),
+        tools=["file_read", "file_write", "code_exec", "shell"],
+        allow_delegation=False,
+        verbose=True,
+    ),
+    "writer": AgentConfig(
+        role="Technical Writer",
+        goal="Create clear, accurate documentation that helps users and developers "
+        "understand the system",
+        backstory=(
+            "You believe good documentation is as important as good code. You "
+            "write for your audience—concise for experts, detailed for beginners. "
+            "You keep docs in sync with code."
+        ),
+        tools=["file_read", "file_write", "web_search"],
+        allow_delegation=False,
+        verbose=True,
+    ),
+}
+
+
+class SpecializedAgent(BaseAgent):
+    """Agent whose configuration comes from ``AGENT_CONFIGS``.
+
+    Can be instantiated directly with a kind (``SpecializedAgent("coder")``)
+    or through the named subclasses such as ``CoderAgent``.
+    """
+
+    __slots__ = ()
+
+    kind: str = ""
+
+    def __init__(self, kind: str | None = None) -> None:
+        """Initialize the agent from the registry.
+
+        Args:
+            kind: Registry key. Defaults to the subclass's ``kind``.
+
+        Raises:
+            KeyError: If the kind is not registered.
+        """
+        super().__init__(AGENT_CONFIGS[kind or self.kind])
+
+    def get_tools(self) -> list[Any]:
+        """Get the tools named in this agent's configuration.
+
+        Returns:
+            List of tool instances.
+        """
+        if self._tools is None:
+            self._tools = get_tools_by_names(self.config.tools)
+        return self._tools
+
+
+def _specialize(name: str, kind: str, doc: str) -> type[SpecializedAgent]:
+    """Create a named SpecializedAgent subclass bound to a registry kind."""
+    namespace = {"__slots__": (), "__module__": __name__, "__doc__": doc, "kind": kind}
+    return type(name, (SpecializedAgent,), namespace)
+
+
+AnalystAgent = _specialize("AnalystAgent", "analyst", "Senior Requirements Analyst agent.")
+ArchitectAgent = _specialize("ArchitectAgent", "architect", "System Architect agent.")
+CoderAgent = _specialize("CoderAgent", "coder", "Senior Software Engineer agent.")
+ResearcherAgent = _specialize("ResearcherAgent", "researcher", "Technical Researcher agent.")
+ReviewerAgent = _specialize("ReviewerAgent", "reviewer", "Code Reviewer agent.")
+TesterAgent = _specialize("TesterAgent", "tester", "QA Engineer agent.")
+WriterAgent = _specialize("WriterAgent", "writer", "Technical Writer agent.")
@@ -1,27 +1,40 @@
 """FastAPI server for Lloyd GUI."""
 
 import asyncio
-import json
+import importlib.util
 import logging
 import secrets
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
 import uvicorn
-from fastapi import Depends, FastAPI, HTTPException, WebSocket, WebSocketDisconnect, status
+from fastapi import (
+    Depends,
+    FastAPI,
+    HTTPException,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
 from lloyd import __version__
 from lloyd.brainstorm.session import BrainstormSession, BrainstormStore
+from lloyd.config import get_ollama_host
 from lloyd.extensions.manager import ExtensionManager
 from lloyd.extensions.scaffold import create_extension_scaffold
 from lloyd.inbox.store import InboxStore
 from lloyd.knowledge.store import KnowledgeStore
+from lloyd.orchestrator.flow import LloydFlow, run_lloyd
+from lloyd.orchestrator.idea_queue import IdeaQueue
+from lloyd.selfmod.clone_manager import LloydCloneManager
 from lloyd.selfmod.queue import SelfModQueue
 
 # Configure logger
@@ -49,7 +62,7 @@ def get_or_create_api_key() -> str:
         key = secrets.token_urlsafe(32)
         API_KEY_FILE.parent.mkdir(parents=True, exist_ok=True)
         API_KEY_FILE.write_text(key)
-        logger.info(f"Generated new API key, stored in {API_KEY_FILE}")
+        logger.info("Generated new API key, stored in %s", API_KEY_FILE)
         return key
 
 
@@ -96,6 +109,16 @@ def verify_websocket_token(token: str | None) -> bool:
     """
     return token == API_KEY
 
+
+class ORJSONResponse(Response):
+    """JSON response serialized with orjson."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 # Frontend path
 FRONTEND_DIR = Path(__file__).parent / "frontend" / "dist"
 
@@ -103,6 +126,7 @@ app = FastAPI(
     title="Lloyd API",
     description="AI Executive Assistant API",
     version=__version__,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS for frontend development
@@ -114,6 +138,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Resolve the built frontend once at startup instead of stat-ing per request
+_INDEX_HTML = FRONTEND_DIR / "index.html"
+_HAS_FRONTEND = _INDEX_HTML.is_file()
+_FRONTEND_FILES: frozenset[str] = frozenset(
+    p.name for p in FRONTEND_DIR.iterdir() if p.is_file()
+) if _HAS_FRONTEND else frozenset()
+
 # Mount static assets if frontend exists
 if FRONTEND_DIR.exists():
     app.mount("/assets", StaticFiles(directory=str(FRONTEND_DIR / "assets")), name="assets")
@@ -121,31 +152,179 @@ if FRONTEND_DIR.exists():
 
 # WebSocket connections for real-time updates
 class ConnectionManager:
-    """Manage WebSocket connections."""
+    """Manage WebSocket connections.
+
+    Each connection gets a bounded outbound queue drained by its own writer
+    task, so a slow client never holds up broadcasts to the others. A client
+    whose queue overflows is closed rather than buffered without limit.
+    """
+
+    SEND_QUEUE_SIZE = 64
 
     def __init__(self) -> None:
-        self.active_connections: list[WebSocket] = []
+        self.active_connections: dict[WebSocket, asyncio.Queue[str | None]] = {}
+        self._writers: dict[WebSocket, asyncio.Task[None]] = {}
 
     async def connect(self, websocket: WebSocket) -> None:
         await websocket.accept()
-        self.active_connections.append(websocket)
+        queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=self.SEND_QUEUE_SIZE)
+        self.active_connections[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(self._write(websocket, queue))
 
     def disconnect(self, websocket: WebSocket) -> None:
-        self.active_connections.remove(websocket)
+        self.active_connections.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+
+    async def _write(self, websocket: WebSocket, queue: asyncio.Queue[str | None]) -> None:
+        """Send queued payloads to one client until it goes away.
+
+        Args:
+            websocket: Client connection.
+            queue: Outbound queue for the client. ``None`` means close.
+        """
+        try:
+            while True:
+                payload = await queue.get()
+                try:
+                    if payload is None:
+                        await websocket.close(code=1013, reason="Client too slow")
+                        return
+                    await websocket.send_text(payload)
+                finally:
+                    queue.task_done()
+        except WebSocketDisconnect:
+            logger.debug("WebSocket disconnected during send")
+        except Exception:
+            logger.debug("WebSocket send failed", exc_info=True)
+        finally:
+            self._discard_backlog(queue)
+            if self._writers.get(websocket) is asyncio.current_task():
+                self.disconnect(websocket)
+
+    @staticmethod
+    def _discard_backlog(queue: asyncio.Queue[str | None]) -> None:
+        """Drop queued messages that will never be sent."""
+        while not queue.empty():
+            queue.get_nowait()
+            queue.task_done()
+
+    def send(self, websocket: WebSocket, payload: str) -> None:
+        """Queue a serialized message for one client.
+
+        Args:
+            websocket: Client connection.
+            payload: JSON text to send.
+        """
+        queue = self.active_connections.get(websocket)
+        if queue is None:
+            return
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            logger.warning("WebSocket client too slow, closing connection")
+            # Stop queueing for it and let the writer close once the backlog is dropped
+            del self.active_connections[websocket]
+            self._discard_backlog(queue)
+            queue.put_nowait(None)
 
     async def broadcast(self, message: dict[str, Any]) -> None:
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except WebSocketDisconnect:
-                # Connection was closed, will be removed in disconnect handler
-                logger.debug("WebSocket disconnected during broadcast")
-            except Exception as e:
-                logger.warning(f"Error broadcasting to WebSocket: {e}")
+        """Queue a message for every connected client.
+
+        Returns without waiting on any client: the per-connection writer
+        tasks send concurrently, so one slow socket costs the others nothing.
+
+        Args:
+            message: JSON-serializable message.
+        """
+        # Serialize once for all clients; sending happens in the writer tasks
+        payload = orjson.dumps(message).decode()
+        for connection in list(self.active_connections):
+            self.send(connection, payload)
+
+    async def flush(self) -> None:
+        """Wait until every queued message has been handed to its client."""
+        await asyncio.gather(*(queue.join() for queue in self.active_connections.values()))
+
+
+class CoalescingBroadcaster:
+    """Broadcast at most one message per interval, keeping only the latest.
+
+    Used for full-state messages such as ``status_update`` where an
+    intermediate state superseded by a newer one is not worth sending.
+    """
+
+    def __init__(self, connections: ConnectionManager, interval: float = 0.25) -> None:
+        self.connections = connections
+        self.interval = interval
+        self._pending: dict[str, Any] | None = None
+        self._ready = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def publish(self, message: dict[str, Any]) -> None:
+        """Replace the pending message and wake the sender.
+
+        Args:
+            message: Message superseding any not yet sent.
+        """
+        self._pending = message
+        self._ready.set()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            message, self._pending = self._pending, None
+            if message is not None:
+                await self.connections.broadcast(message)
+            await asyncio.sleep(self.interval)
+
+    async def close(self) -> None:
+        """Stop the sender and send the latest message if still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        message, self._pending = self._pending, None
+        if message is not None:
+            await self.connections.broadcast(message)
 
 
 manager = ConnectionManager()
 
+# Store singletons shared by all handlers, so their caches stay warm between
+# requests. The inbox store's parsed items and the brainstorm store's session
+# index are reloaded when the file's stat key shows another process wrote it.
+# The extension manager keeps what discover() found so that enable/disable
+# act on it.
+_inbox_store = InboxStore()
+_brainstorm_store = BrainstormStore()
+_knowledge_store = KnowledgeStore()
+_selfmod_queue = SelfModQueue()
+_extension_manager = ExtensionManager()
+
+
+def get_inbox_store() -> InboxStore:
+    """Get the shared inbox store."""
+    return _inbox_store
+
+
+def get_brainstorm_store() -> BrainstormStore:
+    """Get the shared brainstorm store."""
+    return _brainstorm_store
+
+
+def get_knowledge_store() -> KnowledgeStore:
+    """Get the shared knowledge store."""
+    return _knowledge_store
+
+
+def get_selfmod_queue_store() -> SelfModQueue:
+    """Get the shared self-modification queue."""
+    return _selfmod_queue
+
 
 # Pydantic models
 class IdeaRequest(BaseModel):
@@ -198,14 +377,159 @@ class DependencyStatus(BaseModel):
     details: str = ""
 
 
+# Status payload served before any PRD exists; invariant, so encoded once
+_IDLE_STATUS_BODY = orjson.dumps(
+    {
+        "project_name": "No Project",
+        "description": "No PRD found. Submit an idea to get started.",
+        "status": "idle",
+        "total_stories": 0,
+        "completed_stories": 0,
+        "in_progress_stories": 0,
+        "stories": [],
+    }
+)
+
+FileKey = tuple[int, int, int, int]
+
+
+def _stat_key(st: Any) -> FileKey:
+    """Identify a file version by device, inode, mtime and size."""
+    return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+# PRD parse cache keyed by file identity and modification stamp
+_prd_cache: tuple[FileKey, dict[str, Any]] | None = None
+
+
+def _load_prd(prd_path: Path) -> dict[str, Any]:
+    """Load and parse the PRD, reusing the last parse if the file is unchanged.
+
+    Args:
+        prd_path: Path to prd.json.
+
+    Returns:
+        Parsed PRD dict, shared with other callers. It must not be
+        mutated; writers parse their own copy.
+    """
+    global _prd_cache
+    key = _stat_key(prd_path.stat())
+    if _prd_cache is not None and _prd_cache[0] == key:
+        return _prd_cache[1]
+
+    prd: dict[str, Any] = orjson.loads(prd_path.read_bytes())
+    _prd_cache = (key, prd)
+    return prd
+
+
+def _invalidate_prd_cache() -> None:
+    """Drop the cached PRD parse after the file has been written."""
+    global _prd_cache
+    _prd_cache = None
+
+
+# Encoded /api/status payload for the PRD version it was built from
+_status_cache: tuple[FileKey, bytes] | None = None
+
+
+def _status_body(prd_path: Path) -> bytes:
+    """Build the encoded status payload, reusing it while the PRD is unchanged.
+
+    Stories are sorted by priority and counted in a single pass, once per
+    PRD version rather than once per poll.
+
+    Args:
+        prd_path: Path to prd.json.
+
+    Returns:
+        JSON-encoded StatusResponse body.
+    """
+    global _status_cache
+    key = _stat_key(prd_path.stat())
+    if _status_cache is not None and _status_cache[0] == key:
+        return _status_cache[1]
+
+    prd = _load_prd(prd_path)
+    stories = prd.get("stories", [])
+    completed = in_progress = 0
+    for story in stories:
+        if story.get("passes", False):
+            completed += 1
+        if story.get("status") == "in_progress":
+            in_progress += 1
+
+    body = orjson.dumps(
+        {
+            "project_name": prd.get("projectName", "Unknown"),
+            "description": prd.get("description", ""),
+            "status": prd.get("status", "idle"),
+            "total_stories": len(stories),
+            "completed_stories": completed,
+            "in_progress_stories": in_progress,
+            "stories": sorted(stories, key=lambda s: s.get("priority", 999)),
+        }
+    )
+    _status_cache = (key, body)
+    return body
+
+
+# Only the end of the progress log is served; it grows for the life of a project
+PROGRESS_TAIL_BYTES = 64 * 1024
+
+# (version, offset read up to, tail bytes, content, lines) of the last read
+_progress_cache: tuple[FileKey, int, bytes, str, list[str]] | None = None
+
+
+def _read_progress_tail(progress_path: Path) -> tuple[str, list[str]]:
+    """Read the tail of the progress log, reusing the last read if unchanged.
+
+    The log is append-only, so when the same file has grown only the new
+    bytes are read and added to the cached tail.
+
+    Args:
+        progress_path: Path to progress.txt.
+
+    Returns:
+        Tuple of (content, lines) for at most the last PROGRESS_TAIL_BYTES.
+    """
+    global _progress_cache
+    st = progress_path.stat()
+    key = _stat_key(st)
+    cache = _progress_cache
+    if cache is not None and cache[0] == key:
+        return cache[3], cache[4]
+
+    partial = False
+    with open(progress_path, "rb") as f:
+        if cache is not None and cache[0][:2] == key[:2] and cache[1] < st.st_size:
+            f.seek(cache[1])
+            data = cache[2] + f.read()
+        else:
+            start = max(st.st_size - PROGRESS_TAIL_BYTES, 0)
+            f.seek(start)
+            data = f.read()
+            partial = start > 0
+        end = f.tell()
+
+    if len(data) > PROGRESS_TAIL_BYTES:
+        data = data[-PROGRESS_TAIL_BYTES:]
+        partial = True
+    if partial:
+        # Drop the partial first line
+        data = data[data.find(b"\n") + 1 :]
+
+    content = data.decode("utf-8", errors="replace")
+    lines = content.strip().split("\n")
+    _progress_cache = (key, end, data, content, lines)
+    return content, lines
+
+
 # Health check helpers
 async def check_ollama_health() -> DependencyStatus:
     """Check if Ollama is available."""
     import httpx
 
     try:
-        from lloyd.config import get_ollama_host
-
         ollama_host = get_ollama_host()
         async with httpx.AsyncClient(timeout=5.0) as client:
             response = await client.get(f"{ollama_host}/api/tags")
@@ -234,13 +558,12 @@ async def check_prd_health() -> DependencyStatus:
             name="prd", available=True, details="No PRD (ready to create)"
         )
     try:
-        with open(prd_path) as f:
-            prd = json.load(f)
+        prd = await asyncio.to_thread(_load_prd, prd_path)
         story_count = len(prd.get("stories", []))
         return DependencyStatus(
             name="prd", available=True, details=f"{story_count} stories"
         )
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         return DependencyStatus(name="prd", available=False, details=f"Invalid JSON: {e}")
     except Exception as e:
         return DependencyStatus(name="prd", available=False, details=str(e))
@@ -307,48 +630,63 @@ async def liveness_check() -> dict[str, bool]:
     return {"alive": True}
 
 
+# Polled endpoints carry a weak ETag for the file version they were built from
+def _etag(key: FileKey | None) -> str:
+    """Build a weak ETag for a file version, or for the file being absent."""
+    if key is None:
+        return 'W/"none"'
+    return f'W/"{key[1]:x}-{key[2]:x}-{key[3]:x}"'
+
+
+def _not_modified(request: Request, etag: str) -> Response | None:
+    """Return a 304 response if the client already holds this version.
+
+    Args:
+        request: Incoming request.
+        etag: Current ETag of the resource.
+
+    Returns:
+        A 304 response, or None if the full body must be sent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+
 # API Routes
-@app.get("/api/status")
-async def get_status() -> StatusResponse:
+@app.get("/api/status", response_model=StatusResponse)
+async def get_status(request: Request) -> Response:
     """Get current project status."""
     prd_path = Path(".lloyd/prd.json")
-    if not prd_path.exists():
-        return StatusResponse(
-            project_name="No Project",
-            description="No PRD found. Submit an idea to get started.",
-            status="idle",
-            total_stories=0,
-            completed_stories=0,
-            stories=[],
-        )
-
-    with open(prd_path) as f:
-        prd = json.load(f)
-
-    stories = prd.get("stories", [])
-    completed = sum(1 for s in stories if s.get("passes", False))
-    in_progress = sum(1 for s in stories if s.get("status") == "in_progress")
-
-    return StatusResponse(
-        project_name=prd.get("projectName", "Unknown"),
-        description=prd.get("description", ""),
-        status=prd.get("status", "idle"),
-        total_stories=len(stories),
-        completed_stories=completed,
-        in_progress_stories=in_progress,
-        stories=sorted(stories, key=lambda s: s.get("priority", 999)),
-    )
+    key = _stat_key(prd_path.stat()) if prd_path.exists() else None
+    etag = _etag(key)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+
+    if key is None:
+        body = _IDLE_STATUS_BODY
+    else:
+        body = await asyncio.to_thread(_status_body, prd_path)
+    return Response(body, media_type="application/json", headers={"ETag": etag})
 
 
-@app.get("/api/progress")
-async def get_progress() -> ProgressResponse:
+@app.get("/api/progress", response_model=ProgressResponse)
+async def get_progress(request: Request) -> Response:
     """Get progress log."""
     progress_path = Path(".lloyd/progress.txt")
-    if not progress_path.exists():
-        return ProgressResponse(content="", lines=[])
+    key = _stat_key(progress_path.stat()) if progress_path.exists() else None
+    etag = _etag(key)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
 
-    content = progress_path.read_text()
-    return ProgressResponse(content=content, lines=content.strip().split("\n"))
+    if key is None:
+        return ORJSONResponse({"content": "", "lines": []}, headers={"ETag": etag})
+
+    content, lines = await asyncio.to_thread(_read_progress_tail, progress_path)
+    return ORJSONResponse({"content": content, "lines": lines}, headers={"ETag": etag})
 
 
 @app.post("/api/idea", dependencies=[Depends(verify_token)])
@@ -361,8 +699,6 @@ async def submit_idea(request: IdeaRequest) -> dict[str, Any]:
 
         # If queue_only, just add to queue
         if request.queue_only:
-            from lloyd.orchestrator.idea_queue import IdeaQueue
-
             q = IdeaQueue()
             idea = q.add(request.description)
 
@@ -379,8 +715,6 @@ async def submit_idea(request: IdeaRequest) -> dict[str, Any]:
                 "queued": True,
             }
 
-        from lloyd.orchestrator.flow import LloydFlow
-
         parallel = not request.sequential
         flow = LloydFlow(max_parallel=request.max_parallel)
         flow.state.parallel_mode = parallel
@@ -415,6 +749,7 @@ async def submit_idea(request: IdeaRequest) -> dict[str, Any]:
         raise
     except Exception as e:
         # Log the error and return a helpful message
+        logger.exception("Failed to submit idea")
         error_msg = str(e)
         await manager.broadcast({
             "type": "error",
@@ -423,14 +758,20 @@ async def submit_idea(request: IdeaRequest) -> dict[str, Any]:
         raise HTTPException(status_code=500, detail=f"Failed to submit idea: {error_msg}")
 
 
+# Minimum spacing between status_update broadcasts during a run
+STATUS_UPDATE_INTERVAL = 0.25
+
+
 async def run_workflow_async(flow: Any, max_iterations: int, parallel: bool = True) -> None:
     """Run workflow asynchronously with status updates."""
     flow.state.max_iterations = max_iterations
+    status_updates = CoalescingBroadcaster(manager, STATUS_UPDATE_INTERVAL)
 
     try:
         # Planning phase
         await manager.broadcast({"type": "phase", "phase": "planning"})
-        flow.decompose_idea()
+        # Planning and iterations block on LLM calls - keep them off the loop
+        await asyncio.to_thread(flow.decompose_idea)
         await manager.broadcast(
             {"type": "prd_created", "stories": len(flow.prd.stories) if flow.prd else 0}
         )
@@ -447,22 +788,19 @@ async def run_workflow_async(flow: Any, max_iterations: int, parallel: bool = Tr
             )
 
             if parallel:
-                should_continue = flow.run_parallel_iteration()
+                should_continue = await asyncio.to_thread(flow.run_parallel_iteration)
             else:
-                should_continue = flow.run_iteration()
-
-            # Send updated status
-            prd_path = Path(".lloyd/prd.json")
-            if prd_path.exists():
-                with open(prd_path) as f:
-                    prd = json.load(f)
-                in_progress = sum(
-                    1 for s in prd.get("stories", []) if s.get("status") == "in_progress"
-                )
-                await manager.broadcast(
+                should_continue = await asyncio.to_thread(flow.run_iteration)
+
+            # Send updated status from the flow's in-memory PRD, which both
+            # iteration paths keep in sync with what they just saved
+            if flow.prd is not None:
+                stories = [s.model_dump(by_alias=True, mode="json") for s in flow.prd.stories]
+                in_progress = sum(1 for s in stories if s["status"] == "in_progress")
+                status_updates.publish(
                     {
                         "type": "status_update",
-                        "stories": prd.get("stories", []),
+                        "stories": stories,
                         "iteration": flow.state.iteration,
                         "in_progress": in_progress,
                     }
@@ -471,10 +809,11 @@ async def run_workflow_async(flow: Any, max_iterations: int, parallel: bool = Tr
             if not should_continue:
                 break
 
-            # Small delay to prevent overwhelming
-            await asyncio.sleep(0.1)
+            # Yield to other tasks; the iteration itself paces the loop
+            await asyncio.sleep(0)
 
-        # Final status
+        # Final status, after the last story update
+        await status_updates.close()
         await manager.broadcast(
             {
                 "type": "complete",
@@ -484,6 +823,8 @@ async def run_workflow_async(flow: Any, max_iterations: int, parallel: bool = Tr
         )
 
     except Exception as e:
+        logger.exception("Workflow run failed")
+        await status_updates.close()
         await manager.broadcast(
             {
                 "type": "error",
@@ -492,9 +833,8 @@ async def run_workflow_async(flow: Any, max_iterations: int, parallel: bool = Tr
         )
 
 
-@app.post("/api/init", dependencies=[Depends(verify_token)])
-async def initialize_project() -> dict[str, str]:
-    """Initialize a new Lloyd project."""
+def _init_project_files() -> None:
+    """Create the .lloyd directory layout, PRD and progress log if missing."""
     lloyd_dir = Path(".lloyd")
     lloyd_dir.mkdir(exist_ok=True)
     (lloyd_dir / "checkpoints").mkdir(exist_ok=True)
@@ -518,16 +858,45 @@ async def initialize_project() -> dict[str, str]:
                 "actualIterations": 0,
             },
         }
-        with open(prd_path, "w") as f:
-            json.dump(prd, f, indent=2)
+        prd_path.write_bytes(orjson.dumps(prd, option=orjson.OPT_INDENT_2))
+        _invalidate_prd_cache()
 
     progress_path = lloyd_dir / "progress.txt"
     if not progress_path.exists():
         progress_path.write_text("# Lloyd Progress Log\n\n")
 
+
+@app.post("/api/init", dependencies=[Depends(verify_token)])
+async def initialize_project() -> dict[str, str]:
+    """Initialize a new Lloyd project."""
+    await asyncio.to_thread(_init_project_files)
     return {"message": "Lloyd initialized successfully"}
 
 
+def _reset_story_in_prd(prd_path: Path, story_id: str) -> bool:
+    """Reset a story in the PRD file.
+
+    Args:
+        prd_path: Path to prd.json.
+        story_id: ID of the story to reset.
+
+    Returns:
+        True if the story was found and reset.
+    """
+    # Parse a private copy: the cached PRD must not change unless the write succeeds
+    prd: dict[str, Any] = orjson.loads(prd_path.read_bytes())
+
+    for story in prd.get("stories", []):
+        if story.get("id") == story_id:
+            story["passes"] = False
+            story["attempts"] = 0
+            story["notes"] = ""
+            prd_path.write_bytes(orjson.dumps(prd, option=orjson.OPT_INDENT_2))
+            _invalidate_prd_cache()
+            return True
+    return False
+
+
 @app.post("/api/reset-story", dependencies=[Depends(verify_token)])
 async def reset_story(request: StoryReset) -> dict[str, str]:
     """Reset a story's attempt count and status."""
@@ -535,17 +904,8 @@ async def reset_story(request: StoryReset) -> dict[str, str]:
     if not prd_path.exists():
         raise HTTPException(status_code=404, detail="No PRD found")
 
-    with open(prd_path) as f:
-        prd = json.load(f)
-
-    for story in prd.get("stories", []):
-        if story.get("id") == request.story_id:
-            story["passes"] = False
-            story["attempts"] = 0
-            story["notes"] = ""
-            with open(prd_path, "w") as f:
-                json.dump(prd, f, indent=2)
-            return {"message": f"Reset story: {request.story_id}"}
+    if await asyncio.to_thread(_reset_story_in_prd, prd_path, request.story_id):
+        return {"message": f"Reset story: {request.story_id}"}
 
     raise HTTPException(status_code=404, detail=f"Story not found: {request.story_id}")
 
@@ -568,8 +928,6 @@ async def resume_execution(request: ResumeRequest | None = None) -> dict[str, An
     max_parallel = request.max_parallel if request else 3
     parallel = not request.sequential if request else True
 
-    from lloyd.orchestrator.flow import LloydFlow
-
     flow = LloydFlow(max_parallel=max_parallel)
     flow.state.parallel_mode = parallel
     prd = flow.prd
@@ -605,33 +963,37 @@ async def websocket_endpoint(websocket: WebSocket, token: str | None = None) ->
 
     await manager.connect(websocket)
     try:
-        while True:
-            # Keep connection alive
-            data = await websocket.receive_text()
-            if data == "ping":
-                await websocket.send_json({"type": "pong"})
-    except WebSocketDisconnect:
+        # Clients only listen; keepalive uses protocol-level ping frames
+        # handled by the server (see start_server), so incoming messages are
+        # drained without decoding until the client goes away
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+    finally:
         manager.disconnect(websocket)
 
 
 # ============== Inbox API ==============
 
 
-@app.get("/api/inbox")
-async def get_inbox(show_resolved: bool = False) -> list[dict[str, Any]]:
+@app.get("/api/inbox", response_model=list[dict[str, Any]])
+async def get_inbox(
+    show_resolved: bool = False,
+    store: InboxStore = Depends(get_inbox_store),
+) -> ORJSONResponse:
     """Get inbox items."""
-    store = InboxStore()
     if show_resolved:
         items = store.list_all()
     else:
         items = store.list_unresolved()
-    return [item.to_dict() for item in items]
+    return ORJSONResponse([item.to_dict() for item in items])
 
 
 @app.get("/api/inbox/{item_id}")
-async def get_inbox_item(item_id: str) -> dict[str, Any]:
+async def get_inbox_item(
+    item_id: str,
+    store: InboxStore = Depends(get_inbox_store),
+) -> dict[str, Any]:
     """Get a specific inbox item."""
-    store = InboxStore()
     item = store.get(item_id)
     if not item:
         raise HTTPException(status_code=404, detail=f"Inbox item not found: {item_id}")
@@ -643,9 +1005,12 @@ class ResolveRequest(BaseModel):
 
 
 @app.post("/api/inbox/{item_id}/resolve", dependencies=[Depends(verify_token)])
-async def resolve_inbox_item(item_id: str, request: ResolveRequest) -> dict[str, str]:
+async def resolve_inbox_item(
+    item_id: str,
+    request: ResolveRequest,
+    store: InboxStore = Depends(get_inbox_store),
+) -> dict[str, str]:
     """Resolve an inbox item."""
-    store = InboxStore()
     item = store.resolve(item_id, request.action)
     if not item:
         raise HTTPException(status_code=404, detail=f"Inbox item not found: {item_id}")
@@ -653,9 +1018,11 @@ async def resolve_inbox_item(item_id: str, request: ResolveRequest) -> dict[str,
 
 
 @app.delete("/api/inbox/{item_id}", dependencies=[Depends(verify_token)])
-async def delete_inbox_item(item_id: str) -> dict[str, str]:
+async def delete_inbox_item(
+    item_id: str,
+    store: InboxStore = Depends(get_inbox_store),
+) -> dict[str, str]:
     """Delete an inbox item."""
-    store = InboxStore()
     if not store.delete(item_id):
         raise HTTPException(status_code=404, detail=f"Inbox item not found: {item_id}")
     return {"message": f"Deleted inbox item: {item_id}"}
@@ -664,19 +1031,22 @@ async def delete_inbox_item(item_id: str) -> dict[str, str]:
 # ============== Brainstorm API ==============
 
 
-@app.get("/api/brainstorm")
-async def get_brainstorm_sessions() -> list[dict[str, Any]]:
+@app.get("/api/brainstorm", response_model=list[dict[str, Any]])
+async def get_brainstorm_sessions(
+    store: BrainstormStore = Depends(get_brainstorm_store),
+) -> ORJSONResponse:
     """Get all brainstorm sessions."""
-    store = BrainstormStore()
-    sessions = store.list_all()
-    return [s.to_dict() for s in sessions]
+    sessions = await asyncio.to_thread(store.list_all)
+    return ORJSONResponse([s.to_dict() for s in sessions])
 
 
 @app.get("/api/brainstorm/{session_id}")
-async def get_brainstorm_session(session_id: str) -> dict[str, Any]:
+async def get_brainstorm_session(
+    session_id: str,
+    store: BrainstormStore = Depends(get_brainstorm_store),
+) -> dict[str, Any]:
     """Get a specific brainstorm session."""
-    store = BrainstormStore()
-    session = store.get(session_id)
+    session = await asyncio.to_thread(store.get, session_id)
     if not session:
         raise HTTPException(status_code=404, detail=f"Session not found: {session_id}")
     return session.to_dict()
@@ -687,11 +1057,13 @@ class BrainstormRequest(BaseModel):
 
 
 @app.post("/api/brainstorm", dependencies=[Depends(verify_token)])
-async def create_brainstorm_session(request: BrainstormRequest) -> dict[str, Any]:
+async def create_brainstorm_session(
+    request: BrainstormRequest,
+    store: BrainstormStore = Depends(get_brainstorm_store),
+) -> dict[str, Any]:
     """Create a new brainstorm session."""
-    store = BrainstormStore()
     session = BrainstormSession(initial_idea=request.idea)
-    store.save(session)
+    await asyncio.to_thread(store.save, session)
     return session.to_dict()
 
 
@@ -701,34 +1073,41 @@ class ClarificationRequest(BaseModel):
 
 
 @app.post("/api/brainstorm/{session_id}/clarify", dependencies=[Depends(verify_token)])
-async def add_clarification(session_id: str, request: ClarificationRequest) -> dict[str, Any]:
+async def add_clarification(
+    session_id: str,
+    request: ClarificationRequest,
+    store: BrainstormStore = Depends(get_brainstorm_store),
+) -> dict[str, Any]:
     """Add a clarification to a brainstorm session."""
-    store = BrainstormStore()
-    session = store.get(session_id)
+    session = await asyncio.to_thread(store.get, session_id)
     if not session:
         raise HTTPException(status_code=404, detail=f"Session not found: {session_id}")
     session.add_clarification(request.question, request.answer)
-    store.save(session)
+    await asyncio.to_thread(store.save, session)
     return session.to_dict()
 
 
 @app.post("/api/brainstorm/{session_id}/approve", dependencies=[Depends(verify_token)])
-async def approve_brainstorm_session(session_id: str) -> dict[str, str]:
+async def approve_brainstorm_session(
+    session_id: str,
+    store: BrainstormStore = Depends(get_brainstorm_store),
+) -> dict[str, str]:
     """Approve a brainstorm session spec."""
-    store = BrainstormStore()
-    session = store.get(session_id)
+    session = await asyncio.to_thread(store.get, session_id)
     if not session:
         raise HTTPException(status_code=404, detail=f"Session not found: {session_id}")
     session.approve()
-    store.save(session)
+    await asyncio.to_thread(store.save, session)
     return {"message": f"Approved session: {session_id}"}
 
 
 @app.delete("/api/brainstorm/{session_id}", dependencies=[Depends(verify_token)])
-async def delete_brainstorm_session(session_id: str) -> dict[str, str]:
+async def delete_brainstorm_session(
+    session_id: str,
+    store: BrainstormStore = Depends(get_brainstorm_store),
+) -> dict[str, str]:
     """Delete a brainstorm session."""
-    store = BrainstormStore()
-    if not store.delete(session_id):
+    if not await asyncio.to_thread(store.delete, session_id):
         raise HTTPException(status_code=404, detail=f"Session not found: {session_id}")
     return {"message": f"Deleted session: {session_id}"}
 
@@ -736,20 +1115,23 @@ async def delete_brainstorm_session(session_id: str) -> dict[str, str]:
 # ============== Knowledge API ==============
 
 
-@app.get("/api/knowledge")
+@app.get("/api/knowledge", response_model=list[dict[str, Any]])
 async def get_knowledge(
-    category: str | None = None, min_confidence: float = 0.0
-) -> list[dict[str, Any]]:
+    category: str | None = None,
+    min_confidence: float = 0.0,
+    store: KnowledgeStore = Depends(get_knowledge_store),
+) -> ORJSONResponse:
     """Get knowledge entries."""
-    store = KnowledgeStore()
     entries = store.query(category=category, min_confidence=min_confidence)
-    return [e.to_dict() for e in entries]
+    return ORJSONResponse([e.to_dict() for e in entries])
 
 
 @app.get("/api/knowledge/{entry_id}")
-async def get_knowledge_entry(entry_id: str) -> dict[str, Any]:
+async def get_knowledge_entry(
+    entry_id: str,
+    store: KnowledgeStore = Depends(get_knowledge_store),
+) -> dict[str, Any]:
     """Get a specific knowledge entry."""
-    store = KnowledgeStore()
     entry = store.get(entry_id)
     if not entry:
         raise HTTPException(status_code=404, detail=f"Entry not found: {entry_id}")
@@ -757,9 +1139,11 @@ async def get_knowledge_entry(entry_id: str) -> dict[str, Any]:
 
 
 @app.delete("/api/knowledge/{entry_id}", dependencies=[Depends(verify_token)])
-async def delete_knowledge_entry(entry_id: str) -> dict[str, str]:
+async def delete_knowledge_entry(
+    entry_id: str,
+    store: KnowledgeStore = Depends(get_knowledge_store),
+) -> dict[str, str]:
     """Delete a knowledge entry."""
-    store = KnowledgeStore()
     if not store.delete(entry_id):
         raise HTTPException(status_code=404, detail=f"Entry not found: {entry_id}")
     return {"message": f"Deleted entry: {entry_id}"}
@@ -768,11 +1152,12 @@ async def delete_knowledge_entry(entry_id: str) -> dict[str, str]:
 # ============== Self-Modification API ==============
 
 
-@app.get("/api/selfmod/queue")
-async def get_selfmod_queue() -> list[dict[str, Any]]:
+@app.get("/api/selfmod/queue", response_model=list[dict[str, Any]])
+async def get_selfmod_queue(
+    queue: SelfModQueue = Depends(get_selfmod_queue_store),
+) -> ORJSONResponse:
     """Get all self-modification tasks."""
-    queue = SelfModQueue()
-    return [
+    return ORJSONResponse([
         {
             "task_id": t.task_id,
             "description": t.description,
@@ -784,13 +1169,15 @@ async def get_selfmod_queue() -> list[dict[str, Any]]:
             "error_message": t.error_message,
         }
         for t in queue.list_all()
-    ]
+    ])
 
 
 @app.get("/api/selfmod/{task_id}")
-async def get_selfmod_task(task_id: str) -> dict[str, Any]:
+async def get_selfmod_task(
+    task_id: str,
+    queue: SelfModQueue = Depends(get_selfmod_queue_store),
+) -> dict[str, Any]:
     """Get a specific self-modification task."""
-    queue = SelfModQueue()
     task = queue.get(task_id)
     if not task:
         raise HTTPException(status_code=404, detail=f"Task not found: {task_id}")
@@ -807,11 +1194,11 @@ async def get_selfmod_task(task_id: str) -> dict[str, Any]:
 
 
 @app.post("/api/selfmod/{task_id}/approve", dependencies=[Depends(verify_token)])
-async def approve_selfmod_task(task_id: str) -> dict[str, str]:
+async def approve_selfmod_task(
+    task_id: str,
+    queue: SelfModQueue = Depends(get_selfmod_queue_store),
+) -> dict[str, str]:
     """Approve and merge a self-modification task."""
-    from lloyd.selfmod.clone_manager import LloydCloneManager
-
-    queue = SelfModQueue()
     task = queue.get(task_id)
     if not task:
         raise HTTPException(status_code=404, detail=f"Task not found: {task_id}")
@@ -834,11 +1221,11 @@ async def approve_selfmod_task(task_id: str) -> dict[str, str]:
 
 
 @app.post("/api/selfmod/{task_id}/reject", dependencies=[Depends(verify_token)])
-async def reject_selfmod_task(task_id: str) -> dict[str, str]:
+async def reject_selfmod_task(
+    task_id: str,
+    queue: SelfModQueue = Depends(get_selfmod_queue_store),
+) -> dict[str, str]:
     """Reject a self-modification task."""
-    from lloyd.selfmod.clone_manager import LloydCloneManager
-
-    queue = SelfModQueue()
     task = queue.get(task_id)
     if not task:
         raise HTTPException(status_code=404, detail=f"Task not found: {task_id}")
@@ -856,12 +1243,11 @@ async def reject_selfmod_task(task_id: str) -> dict[str, str]:
 # ============== Extensions API ==============
 
 
-@app.get("/api/extensions")
-async def get_extensions() -> list[dict[str, Any]]:
+@app.get("/api/extensions", response_model=list[dict[str, Any]])
+async def get_extensions() -> ORJSONResponse:
     """Get all extensions."""
-    manager = ExtensionManager()
-    extensions = manager.discover()
-    return [
+    extensions = _extension_manager.discover()
+    return ORJSONResponse([
         {
             "name": ext.name,
             "display_name": ext.display_name,
@@ -870,10 +1256,10 @@ async def get_extensions() -> list[dict[str, Any]]:
             "path": str(ext.path),
             "enabled": ext.enabled,
             "error": ext.error,
-            "has_tool": ext.tool_instance is not None,
+            "has_tool": ext.has_tool,
         }
         for ext in extensions
-    ]
+    ])
 
 
 class CreateExtensionRequest(BaseModel):
@@ -898,8 +1284,7 @@ async def create_extension(request: CreateExtensionRequest) -> dict[str, Any]:
 @app.post("/api/extensions/{name}/enable", dependencies=[Depends(verify_token)])
 async def enable_extension(name: str) -> dict[str, str]:
     """Enable an extension."""
-    manager = ExtensionManager()
-    if manager.enable_extension(name):
+    if _extension_manager.enable_extension(name):
         return {"message": f"Enabled extension: {name}"}
     raise HTTPException(status_code=404, detail=f"Extension not found: {name}")
 
@@ -907,8 +1292,7 @@ async def enable_extension(name: str) -> dict[str, str]:
 @app.post("/api/extensions/{name}/disable", dependencies=[Depends(verify_token)])
 async def disable_extension(name: str) -> dict[str, str]:
     """Disable an extension."""
-    manager = ExtensionManager()
-    if manager.disable_extension(name):
+    if _extension_manager.disable_extension(name):
         return {"message": f"Disabled extension: {name}"}
     raise HTTPException(status_code=404, detail=f"Extension not found: {name}")
 
@@ -922,27 +1306,24 @@ async def delete_extension(name: str) -> dict[str, str]:
     if not ext_path.exists():
         raise HTTPException(status_code=404, detail=f"Extension not found: {name}")
     shutil.rmtree(ext_path)
+    _extension_manager.extensions.pop(name, None)
     return {"message": f"Removed extension: {name}"}
 
 
 # ============== Idea Queue API ==============
 
 
-@app.get("/api/queue")
-async def get_idea_queue(show_all: bool = False) -> list[dict[str, Any]]:
+@app.get("/api/queue", response_model=list[dict[str, Any]])
+async def get_idea_queue(show_all: bool = False) -> ORJSONResponse:
     """Get ideas in the queue."""
-    from lloyd.orchestrator.idea_queue import IdeaQueue
-
     q = IdeaQueue()
     ideas = q.list_all() if show_all else q.list_pending()
-    return [idea.to_dict() for idea in ideas]
+    return ORJSONResponse([idea.to_dict() for idea in ideas])
 
 
 @app.get("/api/queue/stats")
 async def get_queue_stats() -> dict[str, int]:
     """Get queue statistics."""
-    from lloyd.orchestrator.idea_queue import IdeaQueue
-
     q = IdeaQueue()
     return q.count()
 
@@ -950,8 +1331,6 @@ async def get_queue_stats() -> dict[str, int]:
 @app.get("/api/queue/{idea_id}")
 async def get_queue_idea(idea_id: str) -> dict[str, Any]:
     """Get a specific queued idea."""
-    from lloyd.orchestrator.idea_queue import IdeaQueue
-
     q = IdeaQueue()
     idea = q.get(idea_id)
     if not idea:
@@ -962,8 +1341,6 @@ async def get_queue_idea(idea_id: str) -> dict[str, Any]:
 @app.post("/api/queue", dependencies=[Depends(verify_token)])
 async def add_to_queue(request: QueueIdeaRequest) -> dict[str, Any]:
     """Add an idea to the queue."""
-    from lloyd.orchestrator.idea_queue import IdeaQueue
-
     q = IdeaQueue()
     idea = q.add(request.description, priority=request.priority)
 
@@ -983,8 +1360,6 @@ async def add_to_queue(request: QueueIdeaRequest) -> dict[str, Any]:
 @app.post("/api/queue/batch", dependencies=[Depends(verify_token)])
 async def add_batch_to_queue(request: BatchIdeaRequest) -> dict[str, Any]:
     """Add multiple ideas to the queue."""
-    from lloyd.orchestrator.idea_queue import IdeaQueue
-
     if not request.ideas:
         raise HTTPException(status_code=400, detail="No ideas provided")
 
@@ -1008,8 +1383,6 @@ async def add_batch_to_queue(request: BatchIdeaRequest) -> dict[str, Any]:
 @app.delete("/api/queue/{idea_id}", dependencies=[Depends(verify_token)])
 async def remove_from_queue(idea_id: str) -> dict[str, str]:
     """Remove an idea from the queue."""
-    from lloyd.orchestrator.idea_queue import IdeaQueue
-
     q = IdeaQueue()
     if not q.remove(idea_id):
         raise HTTPException(status_code=404, detail=f"Idea not found: {idea_id}")
@@ -1026,8 +1399,6 @@ async def remove_from_queue(idea_id: str) -> dict[str, str]:
 @app.post("/api/queue/clear", dependencies=[Depends(verify_token)])
 async def clear_queue(completed_only: bool = True) -> dict[str, Any]:
     """Clear completed ideas from the queue."""
-    from lloyd.orchestrator.idea_queue import IdeaQueue
-
     q = IdeaQueue()
     removed = q.clear_completed()
 
@@ -1052,8 +1423,6 @@ async def run_queue(
     limit: int = 0,
 ) -> dict[str, Any]:
     """Start processing the idea queue."""
-    from lloyd.orchestrator.idea_queue import IdeaQueue
-
     q = IdeaQueue()
     pending = q.list_pending()
 
@@ -1090,9 +1459,6 @@ async def run_queue_async(
     sequential: bool,
 ) -> None:
     """Process queued ideas asynchronously."""
-    from lloyd.orchestrator.flow import run_lloyd
-    from lloyd.orchestrator.idea_queue import IdeaQueue
-
     q = IdeaQueue()
     parallel = not sequential
 
@@ -1110,8 +1476,6 @@ async def run_queue_async(
 
         try:
             # Run in executor to not block event loop
-            import asyncio
-
             loop = asyncio.get_event_loop()
             state = await loop.run_in_executor(
                 None,
@@ -1141,14 +1505,16 @@ async def run_queue_async(
             })
 
         except Exception as e:
-            q.complete(idea.id, success=False, error=str(e))
+            logger.exception("Queued idea %s failed", idea.id)
+            error = str(e)
+            q.complete(idea.id, success=False, error=error)
             await manager.broadcast({
                 "type": "queue_progress",
                 "current": i,
                 "total": len(ideas),
                 "idea_id": idea.id,
                 "status": "error",
-                "error": str(e),
+                "error": error,
             })
 
     # Final summary
@@ -1162,9 +1528,9 @@ async def run_queue_async(
 @app.get("/")
 async def serve_frontend_root() -> FileResponse:
     """Serve the frontend index.html."""
-    if FRONTEND_DIR.exists():
-        return FileResponse(FRONTEND_DIR / "index.html")
-    return FileResponse(status_code=404)
+    if _HAS_FRONTEND:
+        return FileResponse(_INDEX_HTML)
+    raise HTTPException(status_code=404, detail="Frontend not found")
 
 
 @app.get("/{path:path}")
@@ -1173,42 +1539,61 @@ async def serve_frontend(path: str) -> FileResponse:
     if path.startswith("api/") or path == "ws":
         raise HTTPException(status_code=404, detail="Not found")
 
-    # Check if it's a static file
-    file_path = FRONTEND_DIR / path
-    if file_path.exists() and file_path.is_file():
-        return FileResponse(file_path)
+    if not _HAS_FRONTEND:
+        raise HTTPException(status_code=404, detail="Frontend not found")
+
+    # Top-level static files (favicon etc.); /assets is served by StaticFiles
+    if path in _FRONTEND_FILES:
+        return FileResponse(FRONTEND_DIR / path)
 
     # Return index.html for SPA routing
-    if FRONTEND_DIR.exists():
-        return FileResponse(FRONTEND_DIR / "index.html")
+    return FileResponse(_INDEX_HTML)
 
-    raise HTTPException(status_code=404, detail="Frontend not found")
+
+# Seconds between WebSocket ping frames, and to wait for the pong
+WS_PING_INTERVAL = 20.0
 
 
 def start_server() -> None:
     """Start the Lloyd API server."""
-    print(f"Starting Lloyd Server v{__version__}")
-    print("API: http://localhost:8000/api")
-    print("GUI: http://localhost:8000")
-    print()
-    print("=" * 50)
-    print("AUTHENTICATION")
-    print("=" * 50)
-    print(f"API Key: {API_KEY}")
-    print(f"Key file: {API_KEY_FILE}")
-    print()
-    print("Use with curl:")
-    print(f'  curl -H "Authorization: Bearer {API_KEY}" http://localhost:8000/api/status')
-    print()
-    print("WebSocket connection:")
-    print(f"  ws://localhost:8000/ws?token={API_KEY}")
-    print("=" * 50)
-    print()
-
-    if not FRONTEND_DIR.exists():
-        print("Warning: Frontend not built. Run 'npm run build' in src/lloyd/frontend/")
-
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Nothing has configured logging when run as lloyd-server; the banner holds the API key
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    logger.info("Starting Lloyd Server v%s", __version__)
+    logger.info("API: http://localhost:8000/api")
+    logger.info("GUI: http://localhost:8000")
+    logger.info("API Key: %s (key file: %s)", API_KEY, API_KEY_FILE)
+    logger.info(
+        'Use with curl: curl -H "Authorization: Bearer %s" http://localhost:8000/api/status',
+        API_KEY,
+    )
+    logger.info("WebSocket connection: ws://localhost:8000/ws?token=%s", API_KEY)
+
+    if not _HAS_FRONTEND:
+        logger.warning("Frontend not built. Run 'npm run build' in src/lloyd/frontend/")
+
+    # uvicorn[standard] ships uvloop and httptools; ask for them explicitly and
+    # say so when the extra is missing instead of silently falling back
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    if loop == "asyncio" or http == "h11":
+        logger.warning(
+            "uvloop/httptools not installed; install uvicorn[standard] for best performance"
+        )
+
+    # Single worker: connections, caches and running workflows live in this process.
+    # WebSocket keepalive is done with protocol ping frames, not app messages.
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop=loop,
+        http=http,
+        ws_ping_interval=WS_PING_INTERVAL,
+        ws_ping_timeout=WS_PING_INTERVAL,
+    )
 
 
 if __name__ == "__main__":
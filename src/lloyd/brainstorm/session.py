@@ -1,18 +1,21 @@
 """Brainstorming session models and storage for Lloyd."""
 
-import json
-import uuid
+import secrets
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+from lloyd.utils.session_index import SessionIndex, read_json
+
 
 @dataclass
 class BrainstormSession:
     """A brainstorming session for refining vague ideas into specs."""
 
-    session_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    session_id: str = field(default_factory=lambda: secrets.token_hex(4))
     initial_idea: str = ""
     clarifications: list[dict[str, str]] = field(default_factory=list)  # [{question, answer}]
     spec: str | None = None
@@ -70,7 +73,12 @@ class BrainstormSession:
 
 
 class BrainstormStore:
-    """Persistent storage for brainstorm sessions."""
+    """Persistent storage for brainstorm sessions.
+
+    Each session lives in its own ``<session_id>.json`` file. A
+    ``SessionIndex`` holding every session's data lets ``list_all`` read one
+    file instead of one per session.
+    """
 
     def __init__(self, lloyd_dir: Path | None = None) -> None:
         """Initialize the brainstorm store.
@@ -80,6 +88,7 @@ class BrainstormStore:
         """
         self.lloyd_dir = lloyd_dir or Path(".lloyd")
         self.brainstorm_dir = self.lloyd_dir / "brainstorms"
+        self.index = SessionIndex(self.brainstorm_dir, dict)
 
     def _ensure_dir(self) -> None:
         """Ensure the brainstorm directory exists."""
@@ -92,9 +101,10 @@ class BrainstormStore:
             session: The session to save.
         """
         self._ensure_dir()
+        data = session.to_dict()
         path = self.brainstorm_dir / f"{session.session_id}.json"
-        with open(path, "w") as f:
-            json.dump(session.to_dict(), f, indent=2)
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        self.index.update(session.session_id, data)
 
     def get(self, session_id: str) -> BrainstormSession | None:
         """Get a brainstorm session by ID.
@@ -108,9 +118,7 @@ class BrainstormStore:
         path = self.brainstorm_dir / f"{session_id}.json"
         if not path.exists():
             return None
-        with open(path) as f:
-            data = json.load(f)
-        return BrainstormSession.from_dict(data)
+        return BrainstormSession.from_dict(read_json(path))
 
     def list_sessions(self) -> list[str]:
         """List all session IDs.
@@ -119,7 +127,7 @@ class BrainstormStore:
             List of session IDs.
         """
         self._ensure_dir()
-        return [f.stem for f in self.brainstorm_dir.glob("*.json")]
+        return list(self.index.load())
 
     def list_all(self) -> list[BrainstormSession]:
         """List all brainstorm sessions.
@@ -128,12 +136,7 @@ class BrainstormStore:
             List of all sessions.
         """
         self._ensure_dir()
-        sessions = []
-        for f in self.brainstorm_dir.glob("*.json"):
-            with open(f) as file:
-                data = json.load(file)
-                sessions.append(BrainstormSession.from_dict(data))
-        return sessions
+        return [BrainstormSession.from_dict(data) for data in self.index.load().values()]
 
     def delete(self, session_id: str) -> bool:
         """Delete a brainstorm session.
@@ -147,5 +150,6 @@ class BrainstormStore:
         path = self.brainstorm_dir / f"{session_id}.json"
         if path.exists():
             path.unlink()
+            self.index.update(session_id, None)
             return True
         return False
@@ -2,6 +2,8 @@
 
 import logging
 import os
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -48,13 +50,13 @@ def get_llm_client() -> Any:
     """Get a LangChain-compatible LLM client for direct invocation.
 
     This returns an object with an .invoke() method for direct LLM calls
-    outside of CrewAI.
+    outside of CrewAI. Clients are shared per (provider, model, host), so
+    callers reuse one connection pool.
 
     Returns:
         LangChain-compatible LLM client.
     """
     llm_string = get_llm()
-    ollama_host = get_ollama_host()
 
     # Parse the model string (format: provider/model)
     if "/" in llm_string:
@@ -63,31 +65,70 @@ def get_llm_client() -> Any:
         provider = "ollama"
         model = llm_string
 
-    if provider == "ollama":
-        try:
-            from langchain_ollama import ChatOllama
-            return ChatOllama(model=model, base_url=ollama_host)
-        except ImportError:
-            # Fallback to langchain_community
-            from langchain_community.chat_models import ChatOllama
-            return ChatOllama(model=model, base_url=ollama_host)
+    return _build_llm_client(provider, model, llm_string, get_ollama_host())
+
+
+# LangChain chat model classes by provider, imported on first use
+_PROVIDER_CLASS_CACHE: dict[str, type] = {}
+
+
+def _resolve_provider(provider: str) -> type:
+    """Import the LangChain chat model class for a provider, once.
 
-    elif provider in ("openai", "gpt"):
+    Args:
+        provider: Provider name ('ollama', 'openai' or 'anthropic').
+
+    Returns:
+        Chat model class.
+    """
+    cached = _PROVIDER_CLASS_CACHE.get(provider)
+    if cached is not None:
+        return cached
+
+    chat_cls: type
+    if provider == "openai":
         from langchain_openai import ChatOpenAI
-        return ChatOpenAI(model=model)
 
+        chat_cls = ChatOpenAI
     elif provider == "anthropic":
         from langchain_anthropic import ChatAnthropic
-        return ChatAnthropic(model=model)
 
+        chat_cls = ChatAnthropic
     else:
-        # Default to Ollama
         try:
             from langchain_ollama import ChatOllama
-            return ChatOllama(model=llm_string, base_url=ollama_host)
+
+            chat_cls = ChatOllama
         except ImportError:
-            from langchain_community.chat_models import ChatOllama
-            return ChatOllama(model=llm_string, base_url=ollama_host)
+            # Fallback to langchain_community
+            from langchain_community.chat_models import ChatOllama as CommunityChatOllama
+
+            chat_cls = CommunityChatOllama
+    _PROVIDER_CLASS_CACHE[provider] = chat_cls
+    return chat_cls
+
+
+@lru_cache(maxsize=4)
+def _build_llm_client(provider: str, model: str, llm_string: str, ollama_host: str) -> Any:
+    """Construct the LLM client for a parsed model string.
+
+    Args:
+        provider: Provider prefix of the model string.
+        model: Model name without the provider prefix.
+        llm_string: Full model string, used for unknown providers.
+        ollama_host: Ollama server URL.
+
+    Returns:
+        LangChain-compatible LLM client.
+    """
+    if provider in ("openai", "gpt"):
+        return _resolve_provider("openai")(model=model)
+    if provider == "anthropic":
+        return _resolve_provider("anthropic")(model=model)
+    if provider != "ollama":
+        # Default to Ollama
+        model = llm_string
+    return _resolve_provider("ollama")(model=model, base_url=ollama_host)
 
 
 class LloydSettings(BaseSettings):
@@ -124,67 +165,148 @@ class LloydSettings(BaseSettings):
 AEGISSettings = LloydSettings
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> LloydSettings:
-    """Get Lloyd settings instance."""
+    """Get the process-wide Lloyd settings instance.
+
+    Settings are loaded from the environment and ``.env`` once; call
+    ``get_settings.cache_clear()`` to reload them.
+    """
     return LloydSettings()
 
 
 class LLMHealthChecker:
-    """Check LLM service health and availability."""
+    """Check LLM service health and availability.
+
+    Every check is answered from one ``/api/tags`` snapshot, which is cached
+    for ``cache_ttl`` seconds and fetched over a pooled HTTP client, so
+    liveness and model checks together cost a single request.
+    """
 
-    def __init__(self, base_url: str | None = None, timeout: float = 5.0):
+    def __init__(
+        self, base_url: str | None = None, timeout: float = 5.0, cache_ttl: float = 5.0
+    ):
         """Initialize the health checker.
 
         Args:
             base_url: Ollama server URL. Defaults to configured host.
             timeout: Request timeout in seconds.
+            cache_ttl: Seconds to reuse a snapshot. 0 disables caching.
         """
         self.base_url = base_url or get_ollama_host()
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self._client: Any = None
+        self._snapshot: tuple[float, dict[str, Any]] | None = None
 
-    def check_ollama_sync(self) -> tuple[bool, str]:
-        """Check if Ollama is responding (synchronous).
+    def _get_client(self) -> Any:
+        """Get the shared synchronous HTTP client, creating it on first use."""
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.Client(timeout=self.timeout)
+        return self._client
+
+    def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def _cached_snapshot(self) -> dict[str, Any] | None:
+        """Get the cached snapshot if it is still fresh."""
+        if self._snapshot is not None and time.monotonic() - self._snapshot[0] < self.cache_ttl:
+            return self._snapshot[1]
+        return None
+
+    def _store_snapshot(self, response: Any = None, error: str | None = None) -> dict[str, Any]:
+        """Build a snapshot from a tags response or an error and cache it.
+
+        Args:
+            response: HTTP response from ``/api/tags``.
+            error: Error message if the request failed.
 
         Returns:
-            Tuple of (available, details).
+            Snapshot with ``ok``, ``models`` (name -> model info) and ``error``.
         """
+        models: dict[str, dict[str, Any]] = {}
+        if error is None and response.status_code != 200:
+            error = f"HTTP {response.status_code}"
+        if error is None:
+            for m in response.json().get("models", []):
+                models[m.get("name", "unknown")] = m
+
+        snapshot = {"ok": error is None, "models": models, "error": error}
+        self._snapshot = (time.monotonic(), snapshot)
+        return snapshot
+
+    def _request_error(self, e: Exception) -> str:
+        """Describe a failed request."""
         import httpx
 
+        if isinstance(e, httpx.ConnectError):
+            return f"Connection refused at {self.base_url}"
+        if isinstance(e, httpx.TimeoutException):
+            return f"Timeout after {self.timeout}s"
+        return str(e)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Fetch Ollama's model list once, reusing a fresh cached result.
+
+        Returns:
+            Snapshot with ``ok``, ``models`` (name -> model info) and ``error``.
+        """
+        cached = self._cached_snapshot()
+        if cached is not None:
+            return cached
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(f"{self.base_url}/api/tags")
-                if response.status_code == 200:
-                    data = response.json()
-                    models = data.get("models", [])
-                    model_names = [m.get("name", "unknown") for m in models]
-                    return True, f"{len(models)} models: {', '.join(model_names[:3])}"
-                return False, f"HTTP {response.status_code}"
-        except httpx.ConnectError:
-            return False, f"Connection refused at {self.base_url}"
-        except httpx.TimeoutException:
-            return False, f"Timeout after {self.timeout}s"
+            response = self._get_client().get(f"{self.base_url}/api/tags")
+            return self._store_snapshot(response)
         except Exception as e:
-            return False, str(e)
+            return self._store_snapshot(error=self._request_error(e))
 
-    async def check_ollama_async(self) -> tuple[bool, str]:
-        """Check if Ollama is responding (asynchronous).
+    async def snapshot_async(self) -> dict[str, Any]:
+        """Asynchronous variant of ``snapshot``.
 
         Returns:
-            Tuple of (available, details).
+            Snapshot with ``ok``, ``models`` (name -> model info) and ``error``.
         """
         import httpx
 
+        cached = self._cached_snapshot()
+        if cached is not None:
+            return cached
         try:
+            # Per-call client: a pooled AsyncClient can't outlive its event loop
             async with httpx.AsyncClient(timeout=self.timeout) as client:
                 response = await client.get(f"{self.base_url}/api/tags")
-                if response.status_code == 200:
-                    data = response.json()
-                    models = data.get("models", [])
-                    model_names = [m.get("name", "unknown") for m in models]
-                    return True, f"{len(models)} models: {', '.join(model_names[:3])}"
-                return False, f"HTTP {response.status_code}"
+                return self._store_snapshot(response)
         except Exception as e:
-            return False, str(e)
+            return self._store_snapshot(error=self._request_error(e))
+
+    @staticmethod
+    def _describe(snapshot: dict[str, Any]) -> tuple[bool, str]:
+        """Summarize a snapshot as (available, details)."""
+        if not snapshot["ok"]:
+            return False, snapshot["error"]
+        names = list(snapshot["models"])
+        return True, f"{len(names)} models: {', '.join(names[:3])}"
+
+    def check_ollama_sync(self) -> tuple[bool, str]:
+        """Check if Ollama is responding (synchronous).
+
+        Returns:
+            Tuple of (available, details).
+        """
+        return self._describe(self.snapshot())
+
+    async def check_ollama_async(self) -> tuple[bool, str]:
+        """Check if Ollama is responding (asynchronous).
+
+        Returns:
+            Tuple of (available, details).
+        """
+        return self._describe(await self.snapshot_async())
 
     def check_model_available(self, model_name: str) -> tuple[bool, str]:
         """Check if a specific model is loaded.
@@ -195,21 +317,14 @@ class LLMHealthChecker:
         Returns:
             Tuple of (available, details).
         """
-        import httpx
-
-        try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(f"{self.base_url}/api/tags")
-                if response.status_code == 200:
-                    models = response.json().get("models", [])
-                    for m in models:
-                        if m.get("name") == model_name:
-                            size = m.get("size", 0) / (1024 ** 3)  # Convert to GB
-                            return True, f"Model loaded ({size:.1f}GB)"
-                    return False, f"Model '{model_name}' not found"
-                return False, f"HTTP {response.status_code}"
-        except Exception as e:
-            return False, str(e)
+        snapshot = self.snapshot()
+        if not snapshot["ok"]:
+            return False, snapshot["error"]
+        model = snapshot["models"].get(model_name)
+        if model is None:
+            return False, f"Model '{model_name}' not found"
+        size = model.get("size", 0) / (1024 ** 3)  # Convert to GB
+        return True, f"Model loaded ({size:.1f}GB)"
 
     def quick_check(self) -> bool:
         """Quick health check - just returns True/False.
@@ -217,5 +332,4 @@ class LLMHealthChecker:
         Returns:
             True if Ollama is available, False otherwise.
         """
-        available, _ = self.check_ollama_sync()
-        return available
+        return bool(self.snapshot()["ok"])
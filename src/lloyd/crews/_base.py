@@ -0,0 +1,136 @@
+"""Base class for Lloyd crews."""
+
+from pathlib import Path
+from typing import Any, ClassVar
+
+from crewai import Agent, Crew, Process, Task
+from crewai.agents.agent_builder.base_agent import BaseAgent
+
+from lloyd.config import get_llm
+from lloyd.crews._config import compile_task_descriptions, format_description, load_config
+from lloyd.tools import get_tools_by_names
+
+
+class BaseCrew:
+    """Crew built from the agents.yaml and tasks.yaml in its config directory.
+
+    Subclasses pass their directory as a class keyword, which loads both
+    configs once per class::
+
+        class PlanningCrew(BaseCrew, config_dir=Path(__file__).parent):
+            ...
+
+    Subclasses implement ``create_crew``; agents are created on first use
+    and cached per instance.
+    """
+
+    agents_config: ClassVar[dict[str, Any]]
+    tasks_config: ClassVar[dict[str, Any]]
+
+    def __init_subclass__(cls, config_dir: Path | None = None, **kwargs: Any) -> None:
+        """Load the subclass's YAML configs.
+
+        Args:
+            config_dir: Directory holding agents.yaml and tasks.yaml. Subclasses
+                that omit it inherit their parent's configs.
+        """
+        super().__init_subclass__(**kwargs)
+        if config_dir is not None:
+            cls.agents_config = load_config(config_dir / "agents.yaml")
+            cls.tasks_config = compile_task_descriptions(load_config(config_dir / "tasks.yaml"))
+
+    def __init__(self) -> None:
+        """Initialize the crew."""
+        self._agents: dict[str, Agent] = {}
+        # self._agents values, in creation order, typed as Crew expects
+        self._agent_list: list[BaseAgent] = []
+        self._crew: Crew | None = None
+
+    def _create_agent(self, name: str) -> Agent:
+        """Create an agent from config.
+
+        Args:
+            name: Agent name from config.
+
+        Returns:
+            Configured CrewAI Agent.
+        """
+        agent = self._agents.get(name)
+        if agent is not None:
+            return agent
+
+        config = self.agents_config[name]
+        tools = get_tools_by_names(config.get("tools", []))
+
+        agent = Agent(
+            role=config["role"],
+            goal=config["goal"],
+            backstory=config["backstory"],
+            tools=tools,
+            llm=get_llm(),
+            allow_delegation=config.get("allow_delegation", False),
+            verbose=config.get("verbose", True),
+        )
+
+        self._agents[name] = agent
+        self._agent_list.append(agent)
+        return agent
+
+    def _create_task(self, name: str, inputs: dict[str, Any]) -> Task:
+        """Create a task from config.
+
+        Args:
+            name: Task name from config.
+            inputs: Input values for task description formatting.
+
+        Returns:
+            Configured CrewAI Task.
+        """
+        config = self.tasks_config[name]
+        agent = self._create_agent(config["agent"])
+
+        return Task(
+            description=format_description(config, inputs),
+            expected_output=config["expected_output"],
+            agent=agent,
+        )
+
+    def _build_crew(self, tasks: list[Task]) -> Crew:
+        """Assemble a sequential crew from tasks and the agents they use.
+
+        Args:
+            tasks: Tasks to run in order.
+
+        Returns:
+            Configured Crew ready for execution.
+        """
+        self._crew = Crew(
+            agents=self._agent_list,
+            tasks=tasks,
+            process=Process.sequential,
+            verbose=True,
+        )
+        return self._crew
+
+    def create_crew(self, inputs: dict[str, Any]) -> Crew:
+        """Create the crew with its tasks.
+
+        Args:
+            inputs: Crew-specific input values.
+
+        Returns:
+            Configured Crew ready for execution.
+        """
+        raise NotImplementedError
+
+    def kickoff(self, inputs: dict[str, Any]) -> Any:
+        """Run the crew.
+
+        Args:
+            inputs: Crew-specific input values.
+
+        Returns:
+            Crew execution result.
+        """
+        crew = self.create_crew(inputs)
+        return crew.kickoff()
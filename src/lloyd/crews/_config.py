@@ -0,0 +1,109 @@
+"""Shared YAML config loading for Lloyd crews."""
+
+import string
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# libyaml's C parser when PyYAML was built with it, else the pure-Python loader.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_config(path: Path) -> dict[str, Any]:
+    """Load a crew YAML config file.
+
+    Crews load their configs once per class, so each call parses the file
+    afresh and the caller owns the result.
+
+    Args:
+        path: Path to the config file.
+
+    Returns:
+        Parsed YAML content.
+    """
+    with open(path, encoding="utf-8") as f:
+        config: dict[str, Any] = yaml.load(f, Loader=YAML_LOADER)
+    return config
+
+
+def compile_task_descriptions(tasks_config: dict[str, Any]) -> dict[str, Any]:
+    """Pre-parse each task's description template, in place.
+
+    Templates that only use plain ``{name}`` fields get a
+    ``_description_parsed`` list of ``(literal, field)`` pairs that
+    ``format_description`` joins directly; others keep using ``str.format``.
+
+    Args:
+        tasks_config: Parsed tasks.yaml content.
+
+    Returns:
+        The same config, for chaining.
+    """
+    for config in tasks_config.values():
+        if "_description_parsed" in config:
+            continue
+        parsed: list[tuple[str, str | None]] = []
+        plain = True
+        for literal, field, spec, conversion in string.Formatter().parse(config["description"]):
+            if field is not None and (spec or conversion or not field.isidentifier()):
+                plain = False
+                break
+            parsed.append((literal, field))
+        config["_description_parsed"] = parsed if plain else None
+    return tasks_config
+
+
+def format_description(config: dict[str, Any], inputs: dict[str, Any]) -> str:
+    """Fill a task's description template with inputs.
+
+    Args:
+        config: Task config, optionally pre-parsed by ``compile_task_descriptions``.
+        inputs: Input values for the template fields.
+
+    Returns:
+        Formatted description.
+
+    Raises:
+        KeyError: If a template field is missing from inputs.
+    """
+    parsed = config.get("_description_parsed")
+    if parsed is None:
+        description: str = config["description"]
+        return description.format(**inputs)
+    return "".join(
+        [literal if field is None else literal + str(inputs[field]) for literal, field in parsed]
+    )
+
+
+def format_bullets(items: list[str]) -> str:
+    """Render items as a markdown bullet list for task descriptions.
+
+    Args:
+        items: Bullet texts, e.g. acceptance criteria.
+
+    Returns:
+        One ``- item`` line per item.
+    """
+    return "\n".join(map("- {}".format, items))
+
+
+def truncate(value: Any, limit: int) -> str:
+    """Get at most ``limit`` characters of a value's text for a task input.
+
+    Strings are sliced directly. Crew outputs are sliced from their ``raw``
+    text, so a large structured result is never rendered in full.
+
+    Args:
+        value: String, crew output, or any other object.
+        limit: Maximum number of characters.
+
+    Returns:
+        Truncated text.
+    """
+    if isinstance(value, str):
+        return value[:limit]
+    raw = getattr(value, "raw", None)
+    if isinstance(raw, str):
+        return raw[:limit]
+    return str(value)[:limit]
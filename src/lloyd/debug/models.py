@@ -2,10 +2,15 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Literal
+from functools import lru_cache
+from typing import Any, Literal
 
+# Session files are re-read by every list_all, so the same timestamps are parsed repeatedly.
+# datetimes are immutable, so cached instances can be shared between sessions.
+_iso_to_datetime = lru_cache(maxsize=4096)(datetime.fromisoformat)
 
-@dataclass
+
+@dataclass(slots=True)
 class DebugAttempt:
     """A single debugging attempt within a session."""
 
@@ -15,7 +20,7 @@ class DebugAttempt:
     feedback_type: Literal["fixed", "regression", "partial", "no_effect"] | None = None
     timestamp: datetime = field(default_factory=datetime.now)
 
-    def to_dict(self) -> dict:
+    def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
             "attempt_number": self.attempt_number,
@@ -26,14 +31,18 @@ class DebugAttempt:
         }
 
     @classmethod
-    def from_dict(cls, data: dict) -> "DebugAttempt":
+    def from_dict(cls, data: dict[str, Any]) -> "DebugAttempt":
         """Create from dictionary."""
-        data = data.copy()
-        data["timestamp"] = datetime.fromisoformat(data["timestamp"])
-        return cls(**data)
+        return cls(
+            attempt_number=data["attempt_number"],
+            approach=data["approach"],
+            result=data["result"],
+            feedback_type=data.get("feedback_type"),
+            timestamp=_iso_to_datetime(data["timestamp"]),
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class DebugSession:
     """A debugging session for iterative bug fixing."""
 
@@ -91,7 +100,7 @@ class DebugSession:
             if a.feedback_type in ["no_effect", "regression"]
         ]
 
-    def to_dict(self) -> dict:
+    def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
             "session_id": self.session_id,
@@ -104,7 +113,7 @@ class DebugSession:
         }
 
     @classmethod
-    def from_dict(cls, data: dict) -> "DebugSession":
+    def from_dict(cls, data: dict[str, Any]) -> "DebugSession":
         """Create from dictionary."""
         attempts = [DebugAttempt.from_dict(a) for a in data.get("attempts", [])]
         return cls(
@@ -114,5 +123,5 @@ class DebugSession:
             attempts=attempts,
             status=data["status"],
             max_attempts=data["max_attempts"],
-            created_at=datetime.fromisoformat(data["created_at"]),
+            created_at=_iso_to_datetime(data["created_at"]),
         )
@@ -1,13 +1,27 @@
 """Debug session storage for Lloyd."""
 
-import json
 from pathlib import Path
+from typing import Any
+
+import orjson
+
+from lloyd.utils.session_index import SessionIndex, read_json
 
 from .models import DebugSession
 
 
+def _session_status(data: dict[str, Any]) -> str:
+    """Get a session's index entry: its status."""
+    return str(data.get("status", "in_progress"))
+
+
 class DebugStore:
-    """Persistent storage for debug sessions."""
+    """Persistent storage for debug sessions.
+
+    Besides one JSON file per session, the store keeps a ``SessionIndex``
+    mapping session IDs to their status, so listing active sessions does
+    not parse every session body.
+    """
 
     def __init__(self, lloyd_dir: Path | None = None) -> None:
         """Initialize the debug store.
@@ -17,6 +31,7 @@ class DebugStore:
         """
         self.lloyd_dir = lloyd_dir or Path(".lloyd")
         self.debug_dir = self.lloyd_dir / "debug"
+        self.index = SessionIndex(self.debug_dir, _session_status)
 
     def _ensure_dir(self) -> None:
         """Ensure the debug directory exists."""
@@ -33,8 +48,11 @@ class DebugStore:
             session: The session to save.
         """
         self._ensure_dir()
-        with open(self._session_path(session.session_id), "w") as f:
-            json.dump(session.to_dict(), f, indent=2)
+        data = session.to_dict()
+        self._session_path(session.session_id).write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        )
+        self.index.update(session.session_id, data)
 
     def get(self, session_id: str) -> DebugSession | None:
         """Get a debug session by ID.
@@ -48,9 +66,7 @@ class DebugStore:
         path = self._session_path(session_id)
         if not path.exists():
             return None
-        with open(path) as f:
-            data = json.load(f)
-        return DebugSession.from_dict(data)
+        return DebugSession.from_dict(read_json(path))
 
     def list_active(self) -> list[str]:
         """List session IDs that are in progress.
@@ -59,13 +75,11 @@ class DebugStore:
             List of active session IDs.
         """
         self._ensure_dir()
-        active = []
-        for f in self.debug_dir.glob("*.json"):
-            with open(f) as file:
-                data = json.load(file)
-                if data.get("status") == "in_progress":
-                    active.append(data["session_id"])
-        return active
+        return [
+            session_id
+            for session_id, status in self.index.load().items()
+            if status == "in_progress"
+        ]
 
     def list_all(self) -> list[DebugSession]:
         """List all debug sessions.
@@ -74,12 +88,7 @@ class DebugStore:
             List of all sessions.
         """
         self._ensure_dir()
-        sessions = []
-        for f in self.debug_dir.glob("*.json"):
-            with open(f) as file:
-                data = json.load(file)
-                sessions.append(DebugSession.from_dict(data))
-        return sessions
+        return [DebugSession.from_dict(data) for data in self.index.read_sessions()]
 
     def delete(self, session_id: str) -> bool:
         """Delete a debug session.
@@ -93,5 +102,6 @@ class DebugStore:
         path = self._session_path(session_id)
         if path.exists():
             path.unlink()
+            self.index.update(session_id, None)
             return True
         return False
@@ -1,6 +1,5 @@
 """Base classes for Lloyd extensions."""
 
-import functools
 from collections.abc import Callable
 from typing import Any
 
@@ -9,14 +8,26 @@ def tool_method(func: Callable) -> Callable:
     """Decorator to mark a method as a tool method.
 
     Tool methods are exposed to the LLM and can be called during execution.
+    The method itself is returned, so calls go through no extra wrapper.
     """
+    func._is_tool_method = True  # type: ignore[attr-defined]
+    return func
 
-    @functools.wraps(func)
-    def wrapper(*args: Any, **kwargs: Any) -> Any:
-        return func(*args, **kwargs)
 
-    wrapper._is_tool_method = True  # type: ignore
-    return wrapper
+# First ExtensionTool subclass defined in each module, keyed by module name
+_REGISTERED_TOOLS: dict[str, type["ExtensionTool"]] = {}
+
+
+def pop_registered_tool(module_name: str) -> type["ExtensionTool"] | None:
+    """Take the tool class registered for a module, if any.
+
+    Args:
+        module_name: Name of the module that defined the class
+
+    Returns:
+        The first ExtensionTool subclass the module defined, or None
+    """
+    return _REGISTERED_TOOLS.pop(module_name, None)
 
 
 class ExtensionTool:
@@ -29,6 +40,24 @@ class ExtensionTool:
     name: str = "unnamed"
     description: str = ""
 
+    # Names of @tool_method methods, collected once per class
+    _tool_method_names: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Register the subclass and collect its tool method names.
+
+        Tool method names include inherited ones. Only the first subclass
+        defined in a module is registered as that module's tool.
+        """
+        super().__init_subclass__(**kwargs)
+        _REGISTERED_TOOLS.setdefault(cls.__module__, cls)
+        names = []
+        for name in dir(cls):
+            attr = getattr(cls, name)
+            if callable(attr) and getattr(attr, "_is_tool_method", False):
+                names.append(name)
+        cls._tool_method_names = tuple(names)
+
     def __init__(self, config: dict | None = None):
         """Initialize the extension tool.
 
@@ -44,8 +73,7 @@ class ExtensionTool:
             List of tool method descriptors
         """
         methods = []
-        for name in dir(self):
+        for name in self._tool_method_names:
             attr = getattr(self, name)
-            if callable(attr) and getattr(attr, "_is_tool_method", False):
-                methods.append({"name": name, "description": attr.__doc__ or "", "method": attr})
+            methods.append({"name": name, "description": attr.__doc__ or "", "method": attr})
         return methods
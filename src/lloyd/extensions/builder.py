@@ -1,12 +1,47 @@
 """Build extensions from natural language descriptions."""
 
+import os
 import re
 from pathlib import Path
+from typing import Any
 
 import yaml
 
 from .scaffold import create_extension_scaffold
 
+# libyaml-backed loader and dumper when available, else the pure-Python ones.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# External services recognised in ideas, in priority order
+_SERVICES = (
+    "notion",
+    "spotify",
+    "slack",
+    "discord",
+    "calendar",
+    "google",
+    "dropbox",
+    "github",
+    "trello",
+    "asana",
+    "todoist",
+    "obsidian",
+)
+_SERVICE_PRIORITY = {service: i for i, service in enumerate(_SERVICES)}
+# All services as one alternation, so the idea is scanned once
+_SERVICE_RE = re.compile("|".join(map(re.escape, _SERVICES)), re.IGNORECASE)
+
+# Purpose patterns, tried in order against the lowercased idea
+_PURPOSE_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"(sync|push|pull|connect|integrate|link)\s+(.+)",
+        r"so\s+(?:i\s+can|that\s+i\s+can)\s+(.+)",
+        r"to\s+(.+?)(?:\.|$)",
+    )
+)
+
 
 def build_extension_from_idea(idea: str) -> dict:
     """Build an extension from a natural language description.
@@ -61,25 +96,10 @@ def extract_service_name(idea: str) -> str | None:
     Returns:
         Service name if found
     """
-    services = [
-        "notion",
-        "spotify",
-        "slack",
-        "discord",
-        "calendar",
-        "google",
-        "dropbox",
-        "github",
-        "trello",
-        "asana",
-        "todoist",
-        "obsidian",
-    ]
-    idea_lower = idea.lower()
-    for service in services:
-        if service in idea_lower:
-            return service.title()
-    return None
+    found: set[str] = {match.lower() for match in _SERVICE_RE.findall(idea)}
+    if not found:
+        return None
+    return min(found, key=_SERVICE_PRIORITY.__getitem__).title()
 
 
 def extract_purpose(idea: str) -> str:
@@ -91,32 +111,16 @@ def extract_purpose(idea: str) -> str:
     Returns:
         Extracted purpose
     """
-    patterns = [
-        r"(sync|push|pull|connect|integrate|link)\s+(.+)",
-        r"so\s+(?:i\s+can|that\s+i\s+can)\s+(.+)",
-        r"to\s+(.+?)(?:\.|$)",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, idea.lower())
+    idea_lower = idea.lower()
+    for pattern in _PURPOSE_PATTERNS:
+        match = pattern.search(idea_lower)
         if match:
             return match.group(1) if len(match.groups()) == 1 else match.group(2)
     return idea[:50]
 
 
-def generate_smart_tool(ext_path: Path, service: str | None, purpose: str, idea: str) -> None:
-    """Generate a smarter tool.py based on the service.
-
-    Args:
-        ext_path: Path to extension directory
-        service: Service name (e.g., "Notion")
-        purpose: Extracted purpose
-        idea: Original idea
-    """
-    class_name = (service or "Custom").replace("-", "").replace("_", "").title()
-
-    # Service-specific templates
-    if service and service.lower() == "notion":
-        tool_code = f'''"""
+# tool.py templates, rendered with str.format (literal braces are doubled)
+_NOTION_TOOL_TEMPLATE = '''"""
 Notion integration for Lloyd.
 Purpose: {purpose}
 """
@@ -173,8 +177,7 @@ class {class_name}Tool(ExtensionTool):
         return f"Would search Notion for: {{query}}"
 '''
 
-    elif service and service.lower() == "spotify":
-        tool_code = f'''"""
+_SPOTIFY_TOOL_TEMPLATE = '''"""
 Spotify integration for Lloyd.
 Purpose: {purpose}
 """
@@ -227,8 +230,7 @@ class {class_name}Tool(ExtensionTool):
         return f"Would search: {{query}}"
 '''
 
-    elif service and service.lower() == "slack":
-        tool_code = f'''"""
+_SLACK_TOOL_TEMPLATE = '''"""
 Slack integration for Lloyd.
 Purpose: {purpose}
 """
@@ -262,10 +264,8 @@ class {class_name}Tool(ExtensionTool):
         return f"Would send to #{{channel}}: {{message}}"
 '''
 
-    else:
-        # Generic template
-        tool_code = f'''"""
-{service or "Custom"} extension for Lloyd.
+_GENERIC_TOOL_TEMPLATE = '''"""
+{service_name} extension for Lloyd.
 Purpose: {purpose}
 Original idea: {idea}
 """
@@ -274,9 +274,9 @@ from lloyd.extensions import ExtensionTool, tool_method
 
 
 class {class_name}Tool(ExtensionTool):
-    """{service or "Custom"} tool."""
+    """{service_name} tool."""
 
-    name = "{(service or "custom").lower()}"
+    name = "{tool_name}"
     description = "{purpose}"
 
     def __init__(self, config: dict = None):
@@ -296,9 +296,57 @@ class {class_name}Tool(ExtensionTool):
         return f"Processed: {{input_text}}"
 '''
 
+_TOOL_TEMPLATES = {
+    "notion": _NOTION_TOOL_TEMPLATE,
+    "spotify": _SPOTIFY_TOOL_TEMPLATE,
+    "slack": _SLACK_TOOL_TEMPLATE,
+}
+
+
+def generate_smart_tool(ext_path: Path, service: str | None, purpose: str, idea: str) -> None:
+    """Generate a smarter tool.py based on the service.
+
+    Args:
+        ext_path: Path to extension directory
+        service: Service name (e.g., "Notion")
+        purpose: Extracted purpose
+        idea: Original idea
+    """
+    class_name = (service or "Custom").replace("-", "").replace("_", "").title()
+
+    # Service-specific templates, falling back to the generic one
+    template = _GENERIC_TOOL_TEMPLATE
+    if service:
+        template = _TOOL_TEMPLATES.get(service.lower(), _GENERIC_TOOL_TEMPLATE)
+    tool_code = template.format(
+        class_name=class_name,
+        purpose=purpose,
+        idea=idea,
+        service_name=service or "Custom",
+        tool_name=(service or "custom").lower(),
+    )
+
     (ext_path / "tool.py").write_text(tool_code)
 
 
+# Config keys each service's generated extension needs
+_SERVICE_CONFIG_REQS: dict[str, list[dict[str, Any]]] = {
+    "notion": [
+        {"key": "NOTION_API_KEY", "description": "Notion API token", "secret": True},
+        {"key": "NOTION_DATABASE_ID", "description": "Default database ID", "secret": False},
+    ],
+    "spotify": [
+        {"key": "SPOTIFY_CLIENT_ID", "description": "Spotify Client ID", "secret": False},
+        {"key": "SPOTIFY_CLIENT_SECRET", "description": "Spotify Client Secret", "secret": True},
+    ],
+    "slack": [{"key": "SLACK_TOKEN", "description": "Slack Bot Token", "secret": True}],
+    "discord": [{"key": "DISCORD_TOKEN", "description": "Discord Bot Token", "secret": True}],
+    "github": [
+        {"key": "GITHUB_TOKEN", "description": "GitHub Personal Access Token", "secret": True},
+    ],
+}
+
+
 def generate_config_requirements(ext_path: Path, service: str | None) -> None:
     """Generate manifest with config requirements.
 
@@ -306,51 +354,17 @@ def generate_config_requirements(ext_path: Path, service: str | None) -> None:
         ext_path: Path to extension directory
         service: Service name
     """
-    config_reqs = []
-
-    if service:
-        service_lower = service.lower()
-        if service_lower == "notion":
-            config_reqs = [
-                {"key": "NOTION_API_KEY", "description": "Notion API token", "secret": True},
-                {
-                    "key": "NOTION_DATABASE_ID",
-                    "description": "Default database ID",
-                    "secret": False,
-                },
-            ]
-        elif service_lower == "spotify":
-            config_reqs = [
-                {"key": "SPOTIFY_CLIENT_ID", "description": "Spotify Client ID", "secret": False},
-                {
-                    "key": "SPOTIFY_CLIENT_SECRET",
-                    "description": "Spotify Client Secret",
-                    "secret": True,
-                },
-            ]
-        elif service_lower in ["slack", "discord"]:
-            config_reqs = [
-                {
-                    "key": f"{service_lower.upper()}_TOKEN",
-                    "description": f"{service} Bot Token",
-                    "secret": True,
-                }
-            ]
-        elif service_lower == "github":
-            config_reqs = [
-                {
-                    "key": "GITHUB_TOKEN",
-                    "description": "GitHub Personal Access Token",
-                    "secret": True,
-                }
-            ]
+    config_reqs = _SERVICE_CONFIG_REQS.get(service.lower(), []) if service else []
 
     # Update manifest
     manifest_path = ext_path / "manifest.yaml"
     with open(manifest_path, encoding="utf-8") as f:
-        manifest = yaml.safe_load(f)
+        manifest = yaml.load(f, Loader=_YAML_LOADER)
 
     manifest["requires"] = {"config": config_reqs}
 
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        yaml.dump(manifest, f, default_flow_style=False)
+    # Write the whole manifest at once and swap it in, so readers never see half of it
+    text = yaml.dump(manifest, Dumper=_YAML_DUMPER, default_flow_style=False)
+    tmp_path = manifest_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, manifest_path)
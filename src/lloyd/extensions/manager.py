@@ -1,16 +1,43 @@
 """Extension manager for Lloyd."""
 
+import functools
 import importlib.util
-from dataclasses import dataclass
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from .base import ExtensionTool, pop_registered_tool
+
+# libyaml's C parser when PyYAML was built with it, else the pure-Python loader.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# (st_mtime_ns, st_size) of an extension file, or None if it doesn't exist
+FileKey = tuple[int, int] | None
+
+# Tool classes by module name and tool file, with the file key they were executed at
+_tool_class_cache: dict[tuple[str, Path], tuple[FileKey, type[ExtensionTool] | None]] = {}
+
+
+def _file_key(path: Path) -> FileKey:
+    """Get a file's (mtime_ns, size), or None if it doesn't exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
 
 @dataclass
 class Extension:
-    """Represents a loaded extension."""
+    """Represents a loaded extension.
+
+    The tool module is executed lazily, on first access to ``tool_instance``.
+    If that fails, the extension is disabled and ``error`` is set.
+    """
 
     name: str
     display_name: str
@@ -18,9 +45,32 @@ class Extension:
     description: str
     path: Path
     manifest: dict
-    tool_instance: Any | None = None
     enabled: bool = True
     error: str | None = None
+    tool_loader: Callable[[], Any] | None = field(default=None, repr=False, compare=False)
+    _tool: Any | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def tool_instance(self) -> Any | None:
+        """Get the extension's tool instance, loading it on first access."""
+        if self.tool_loader is not None:
+            loader, self.tool_loader = self.tool_loader, None
+            try:
+                self._tool = loader()
+            except Exception as err:
+                self.enabled = False
+                self.error = str(err)
+        return self._tool
+
+    @tool_instance.setter
+    def tool_instance(self, tool: Any | None) -> None:
+        self._tool = tool
+        self.tool_loader = None
+
+    @property
+    def has_tool(self) -> bool:
+        """Whether the extension has a tool, without loading it."""
+        return self._tool is not None or self.tool_loader is not None
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -32,13 +82,15 @@ class Extension:
             "path": str(self.path),
             "enabled": self.enabled,
             "error": self.error,
-            "has_tool": self.tool_instance is not None,
+            "has_tool": self.has_tool,
         }
 
 
 class ExtensionManager:
     """Manages Lloyd extensions."""
 
+    MAX_LOAD_WORKERS = 8
+
     def __init__(self, lloyd_dir: Path | None = None):
         """Initialize the extension manager.
 
@@ -48,41 +100,109 @@ class ExtensionManager:
         self.lloyd_dir = lloyd_dir or Path(".lloyd")
         self.extensions_dir = self.lloyd_dir / "extensions"
         self.extensions: dict[str, Extension] = {}
+        # Loaded extensions by directory, with the file keys they were loaded from
+        self._discovery_cache: dict[Path, tuple[tuple[FileKey, ...], Extension]] = {}
 
     def discover(self) -> list[Extension]:
         """Discover all available extensions.
 
+        Extensions whose manifest, config and tool files are unchanged since
+        the previous call are reused instead of being loaded again. The rest
+        have their manifests and configs read concurrently; tool modules are
+        still only executed on first use.
+
         Returns:
             List of discovered extensions
         """
         self.extensions_dir.mkdir(parents=True, exist_ok=True)
-        extensions = []
+        dir_paths = [
+            dir_path
+            for dir_path in self.extensions_dir.iterdir()
+            if dir_path.is_dir()
+            and not dir_path.name.startswith(".")
+            and (dir_path / "manifest.yaml").exists()
+        ]
 
-        for dir_path in self.extensions_dir.iterdir():
-            if dir_path.is_dir() and not dir_path.name.startswith("."):
-                manifest_path = dir_path / "manifest.yaml"
-                if manifest_path.exists():
-                    try:
-                        ext = self._load_extension(dir_path)
-                        extensions.append(ext)
-                        self.extensions[ext.name] = ext
-                    except Exception as err:
-                        # Create error extension entry
-                        ext = Extension(
-                            name=dir_path.name,
-                            display_name=dir_path.name,
-                            version="?",
-                            description="Error loading extension",
-                            path=dir_path,
-                            manifest={},
-                            tool_instance=None,
-                            enabled=False,
-                            error=str(err),
-                        )
-                        extensions.append(ext)
+        cache: dict[Path, tuple[tuple[FileKey, ...], Extension]] = {}
+        stale: list[Path] = []
+        for dir_path in dir_paths:
+            cached = self._discovery_cache.get(dir_path)
+            if cached is not None and cached[0] == self._extension_key(cached[1]):
+                cache[dir_path] = cached
+            else:
+                stale.append(dir_path)
 
+        loaded = dict(zip(stale, self._load_extensions(stale), strict=True))
+        extensions = []
+        for dir_path in dir_paths:
+            if dir_path in cache:
+                ext = cache[dir_path][1]
+            else:
+                ext, ok = loaded[dir_path]
+                if not ok:
+                    extensions.append(ext)
+                    continue
+                cache[dir_path] = (self._extension_key(ext), ext)
+            extensions.append(ext)
+            self.extensions[ext.name] = ext
+
+        self._discovery_cache = cache
         return extensions
 
+    def _load_extensions(self, dir_paths: list[Path]) -> list[tuple[Extension, bool]]:
+        """Load several extensions, concurrently when there are several.
+
+        Args:
+            dir_paths: Paths to extension directories
+
+        Returns:
+            (extension, loaded) pairs in the same order, as from _try_load_extension
+        """
+        if len(dir_paths) <= 1:
+            return [self._try_load_extension(dir_path) for dir_path in dir_paths]
+        with ThreadPoolExecutor(max_workers=min(self.MAX_LOAD_WORKERS, len(dir_paths))) as pool:
+            return list(pool.map(self._try_load_extension, dir_paths))
+
+    def _try_load_extension(self, dir_path: Path) -> tuple[Extension, bool]:
+        """Load an extension, describing any failure as a disabled extension.
+
+        Args:
+            dir_path: Path to extension directory
+
+        Returns:
+            The extension and True, or an error entry and False
+        """
+        try:
+            return self._load_extension(dir_path), True
+        except Exception as err:
+            # Create error extension entry
+            ext = Extension(
+                name=dir_path.name,
+                display_name=dir_path.name,
+                version="?",
+                description="Error loading extension",
+                path=dir_path,
+                manifest={},
+                enabled=False,
+                error=str(err),
+            )
+            return ext, False
+
+    @staticmethod
+    def _extension_key(ext: Extension) -> tuple[FileKey, ...]:
+        """Get the file keys of everything an extension was loaded from.
+
+        Args:
+            ext: Loaded extension
+
+        Returns:
+            Keys of the manifest, config and entry point files
+        """
+        entry_point = ext.manifest.get("entry_point", "tool.py")
+        return tuple(
+            _file_key(ext.path / name) for name in ("manifest.yaml", "config.yaml", entry_point)
+        )
+
     def _load_extension(self, dir_path: Path) -> Extension:
         """Load an extension from a directory.
 
@@ -95,7 +215,7 @@ class ExtensionManager:
         # Load manifest
         manifest_path = dir_path / "manifest.yaml"
         with open(manifest_path, encoding="utf-8") as f:
-            manifest = yaml.safe_load(f)
+            manifest = yaml.load(f, Loader=_YAML_LOADER)
 
         ext = Extension(
             name=manifest.get("name", dir_path.name),
@@ -111,33 +231,64 @@ class ExtensionManager:
         config = {}
         if config_path.exists():
             with open(config_path, encoding="utf-8") as f:
-                config = yaml.safe_load(f) or {}
+                config = yaml.load(f, Loader=_YAML_LOADER) or {}
 
-        # Load tool class
+        # Defer executing the tool module until the tool is used
         entry_point = manifest.get("entry_point", "tool.py")
         tool_path = dir_path / entry_point
-
         if tool_path.exists():
-            spec = importlib.util.spec_from_file_location(f"ext_{ext.name}", tool_path)
-            if spec and spec.loader:
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-
-                # Find ExtensionTool subclass
-                from .base import ExtensionTool
-
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if (
-                        isinstance(attr, type)
-                        and issubclass(attr, ExtensionTool)
-                        and attr is not ExtensionTool
-                    ):
-                        ext.tool_instance = attr(config)
-                        break
+            ext.tool_loader = functools.partial(self._load_tool, ext.name, tool_path, config)
 
         return ext
 
+    @staticmethod
+    def _load_tool(name: str, tool_path: Path, config: dict[str, Any]) -> Any | None:
+        """Instantiate an extension's tool, executing its module if needed.
+
+        The tool class is cached per process, so other managers and later
+        discoveries only execute the module again once the file changes.
+
+        Args:
+            name: Extension name
+            tool_path: Path to the tool module
+            config: Extension configuration
+
+        Returns:
+            Tool instance, or None if the module defines no ExtensionTool
+        """
+        module_name = f"ext_{name}"
+        key = _file_key(tool_path)
+        cache_key = (module_name, tool_path.resolve())
+        cached = _tool_class_cache.get(cache_key)
+        if cached is not None and cached[0] == key:
+            tool_cls = cached[1]
+        else:
+            tool_cls = ExtensionManager._exec_tool_module(module_name, tool_path)
+            _tool_class_cache[cache_key] = (key, tool_cls)
+        return tool_cls(config) if tool_cls is not None else None
+
+    @staticmethod
+    def _exec_tool_module(module_name: str, tool_path: Path) -> type[ExtensionTool] | None:
+        """Execute a tool module and get its tool class.
+
+        Args:
+            module_name: Name to execute the module under
+            tool_path: Path to the tool module
+
+        Returns:
+            The module's ExtensionTool subclass, or None if it defines none
+        """
+        spec = importlib.util.spec_from_file_location(module_name, tool_path)
+        if spec and spec.loader:
+            module = importlib.util.module_from_spec(spec)
+            # Drop any class left by an earlier run of the module
+            pop_registered_tool(module_name)
+            spec.loader.exec_module(module)
+
+            # Classes register themselves on definition; legacy modules name theirs
+            return pop_registered_tool(module_name) or getattr(module, "TOOL_CLASS", None)
+        return None
+
     def get_extension(self, name: str) -> Extension | None:
         """Get an extension by name.
 
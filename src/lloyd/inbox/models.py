@@ -1,21 +1,30 @@
 """Inbox item models for Lloyd."""
 
+import secrets
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Literal
-import uuid
+from typing import Any, Literal, cast
 
+ItemType = Literal["review", "blocked", "question", "failed", "spec_approval"]
+Priority = Literal["high", "normal", "low"]
 
-@dataclass
+
+def _intern(value: Any) -> Any:
+    """Intern a string field value; anything else, such as a legacy null, is kept as is."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
 class InboxItem:
     """An item in the inbox requiring human attention."""
 
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
-    type: Literal["review", "blocked", "question", "failed", "spec_approval"] = "review"
+    id: str = field(default_factory=lambda: secrets.token_hex(4))
+    type: ItemType = "review"
     project_id: str = ""
     title: str = ""
     created_at: datetime = field(default_factory=datetime.now)
-    priority: Literal["high", "normal", "low"] = "normal"
+    priority: Priority = "normal"
     context: dict[str, Any] = field(default_factory=dict)
     actions: list[str] = field(default_factory=list)
     resolved: bool = False
@@ -46,9 +55,23 @@ class InboxItem:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "InboxItem":
-        """Create an InboxItem from a dictionary."""
-        data = data.copy()
-        data["created_at"] = datetime.fromisoformat(data["created_at"])
-        if data.get("resolved_at"):
-            data["resolved_at"] = datetime.fromisoformat(data["resolved_at"])
-        return cls(**data)
+        """Create an InboxItem from a dictionary.
+
+        The type, priority and project ID repeat across items, so they are
+        interned and every loaded item shares one copy of each value.
+        """
+        fromisoformat = datetime.fromisoformat
+        resolved_at = data.get("resolved_at")
+        return cls(
+            id=data["id"],
+            type=cast(ItemType, _intern(data.get("type", "review"))),
+            project_id=_intern(data.get("project_id", "")),
+            title=data.get("title", ""),
+            created_at=fromisoformat(data["created_at"]),
+            priority=cast(Priority, _intern(data.get("priority", "normal"))),
+            context=data.get("context", {}),
+            actions=data.get("actions", []),
+            resolved=data.get("resolved", False),
+            resolved_at=fromisoformat(resolved_at) if resolved_at else None,
+            resolution=data.get("resolution"),
+        )
@@ -1,13 +1,37 @@
 """Inbox storage for Lloyd."""
 
-import json
+import os
 from pathlib import Path
+from typing import Any
+
+import orjson
+from filelock import FileLock
 
 from .models import InboxItem
 
 
 class InboxStore:
-    """Persistent storage for inbox items."""
+    """Persistent storage for inbox items.
+
+    Items are kept in an append-only JSON Lines log: each line is either a
+    full item record (added or updated) or a ``{"_op": "del", "id": ...}``
+    tombstone. Replaying the log yields the current items. Once superseded
+    records outnumber ``COMPACT_RATIO`` of the live items, the log is
+    rewritten with one line per item. Records are encoded by orjson straight
+    from the dataclass, giving the same fields as ``InboxItem.to_dict``. An
+    unterminated last line is an append that never finished; it is ignored
+    and the next write compacts it away. Writes hold a file lock while they
+    reload the log and write to it, so the CLI and the API server never drop
+    each other's items.
+
+    Items are parsed once and kept in memory; the cache is reloaded when the
+    log's mtime or size shows another writer changed it. Items returned by
+    the store are the cached instances. Unresolved items are also indexed
+    separately, so listing them does not scan resolved ones.
+    """
+
+    COMPACT_RATIO = 0.3
+    LOCK_TIMEOUT = 30.0
 
     def __init__(self, lloyd_dir: Path | None = None) -> None:
         """Initialize the inbox store.
@@ -16,25 +40,105 @@ class InboxStore:
             lloyd_dir: Lloyd data directory. Defaults to .lloyd
         """
         self.lloyd_dir = lloyd_dir or Path(".lloyd")
-        self.inbox_file = self.lloyd_dir / "inbox" / "items.json"
+        self.inbox_file = self.lloyd_dir / "inbox" / "items.jsonl"
+        # Pre-log format: a JSON array of items, migrated on the first write
+        self.legacy_file = self.inbox_file.with_suffix(".json")
+        self._lock = FileLock(str(self.inbox_file.with_suffix(".lock")), timeout=self.LOCK_TIMEOUT)
+        self._items: dict[str, InboxItem] | None = None
+        self._unresolved: dict[str, InboxItem] = {}  # Subset of _items, in the same order
+        self._records = 0  # Lines in the log, including superseded ones
+        self._partial = False  # Whether the log ends in an unterminated line
+        self._file_key: tuple[int, int] | None = None
 
     def _ensure_dir(self) -> None:
         """Ensure the inbox directory exists."""
         self.inbox_file.parent.mkdir(parents=True, exist_ok=True)
 
-    def _load(self) -> list[InboxItem]:
-        """Load all inbox items from storage."""
-        if not self.inbox_file.exists():
-            return []
-        with open(self.inbox_file, "r") as f:
-            data = json.load(f)
-        return [InboxItem.from_dict(d) for d in data]
+    def _stat_key(self) -> tuple[int, int] | None:
+        """Get the log file's (mtime_ns, size), or None if it doesn't exist."""
+        try:
+            st = self.inbox_file.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _load(self) -> dict[str, InboxItem]:
+        """Get all inbox items by ID, replaying the log only if it changed."""
+        key = self._stat_key()
+        if self._items is None or key != self._file_key:
+            items: dict[str, InboxItem] = {}
+            records = 0
+            partial = False
+            loads = orjson.loads
+            from_dict = InboxItem.from_dict
+            if key is not None:
+                with open(self.inbox_file, "rb") as f:
+                    for line in f:
+                        if not line.endswith(b"\n"):
+                            partial = True
+                            continue
+                        if not line.strip():
+                            continue
+                        records += 1
+                        data = loads(line)
+                        if data.get("_op") == "del":
+                            items.pop(data["id"], None)
+                        else:
+                            items[data["id"]] = from_dict(data)
+            elif self.legacy_file.exists():
+                data = loads(self.legacy_file.read_bytes())
+                items = {d["id"]: from_dict(d) for d in data}
+            self._items = items
+            self._index_unresolved(items)
+            self._records = records
+            self._partial = partial
+            self._file_key = key
+        return self._items
+
+    def _index_unresolved(self, items: dict[str, InboxItem]) -> None:
+        """Rebuild the index of unresolved items.
+
+        Args:
+            items: Cached items.
+        """
+        self._unresolved = {item_id: item for item_id, item in items.items() if not item.resolved}
+
+    def _append(self, items: dict[str, InboxItem], record: InboxItem | dict[str, Any]) -> None:
+        """Append one record to the log, compacting it if mostly stale.
+
+        Must be called with the lock held, after reloading the items.
+
+        Args:
+            items: Cached items, with the record already applied.
+            record: Item to write in full, or a deletion tombstone.
+        """
+        self._records += 1
+        stale = self._records - len(items)
+        if self._file_key is None or self._partial or stale > self.COMPACT_RATIO * len(items):
+            # Also creates the log, migrating any legacy items, and drops a
+            # partial last line that an append would otherwise extend
+            self._compact(items)
+            return
 
-    def _save(self, items: list[InboxItem]) -> None:
-        """Save all inbox items to storage."""
+        with open(self.inbox_file, "ab") as f:
+            f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+        self._file_key = self._stat_key()
+
+    def _compact(self, items: dict[str, InboxItem]) -> None:
+        """Atomically rewrite the log with one record per item.
+
+        Args:
+            items: Cached items to keep.
+        """
         self._ensure_dir()
-        with open(self.inbox_file, "w") as f:
-            json.dump([item.to_dict() for item in items], f, indent=2)
+        tmp_path = self.inbox_file.with_suffix(f".{os.getpid()}.tmp")
+        option = orjson.OPT_APPEND_NEWLINE
+        tmp_path.write_bytes(b"".join(orjson.dumps(item, option=option) for item in items.values()))
+        os.replace(tmp_path, self.inbox_file)
+        self.legacy_file.unlink(missing_ok=True)
+        self._records = len(items)
+        self._partial = False
+        self._file_key = self._stat_key()
 
     def add(self, item: InboxItem) -> InboxItem:
         """Add an item to the inbox.
@@ -45,9 +149,17 @@ class InboxStore:
         Returns:
             The added item.
         """
-        items = self._load()
-        items.append(item)
-        self._save(items)
+        self._ensure_dir()
+        with self._lock:
+            items = self._load()
+            replaced = item.id in items
+            items[item.id] = item
+            if replaced:
+                # Keep the index in the items' order
+                self._index_unresolved(items)
+            elif not item.resolved:
+                self._unresolved[item.id] = item
+            self._append(items, item)
         return item
 
     def get(self, item_id: str) -> InboxItem | None:
@@ -59,10 +171,7 @@ class InboxStore:
         Returns:
             The inbox item or None if not found.
         """
-        for item in self._load():
-            if item.id == item_id:
-                return item
-        return None
+        return self._load().get(item_id)
 
     def list_unresolved(self) -> list[InboxItem]:
         """Get all unresolved inbox items.
@@ -70,7 +179,9 @@ class InboxStore:
         Returns:
             List of unresolved items.
         """
-        return [item for item in self._load() if not item.resolved]
+        self._load()
+        # Items resolved directly, not through the store, are still filtered out
+        return [item for item in self._unresolved.values() if not item.resolved]
 
     def list_all(self) -> list[InboxItem]:
         """Get all inbox items.
@@ -78,7 +189,7 @@ class InboxStore:
         Returns:
             List of all items.
         """
-        return self._load()
+        return list(self._load().values())
 
     def resolve(self, item_id: str, action: str) -> InboxItem | None:
         """Resolve an inbox item with an action.
@@ -90,13 +201,16 @@ class InboxStore:
         Returns:
             The resolved item or None if not found.
         """
-        items = self._load()
-        for item in items:
-            if item.id == item_id:
-                item.resolve(action)
-                self._save(items)
-                return item
-        return None
+        self._ensure_dir()
+        with self._lock:
+            items = self._load()
+            item = items.get(item_id)
+            if item is None:
+                return None
+            item.resolve(action)
+            self._unresolved.pop(item_id, None)
+            self._append(items, item)
+        return item
 
     def delete(self, item_id: str) -> bool:
         """Delete an inbox item.
@@ -107,10 +221,11 @@ class InboxStore:
         Returns:
             True if deleted, False if not found.
         """
-        items = self._load()
-        original_len = len(items)
-        items = [item for item in items if item.id != item_id]
-        if len(items) < original_len:
-            self._save(items)
-            return True
-        return False
+        self._ensure_dir()
+        with self._lock:
+            items = self._load()
+            if items.pop(item_id, None) is None:
+                return False
+            self._unresolved.pop(item_id, None)
+            self._append(items, {"_op": "del", "id": item_id})
+        return True
@@ -1,16 +1,17 @@
 """Knowledge/learning entry models for Lloyd."""
 
-import uuid
+import secrets
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class LearningEntry:
     """A learned pattern or piece of knowledge."""
 
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    id: str = field(default_factory=lambda: secrets.token_hex(4))
     category: str = ""  # bug_pattern, fix_strategy, user_preference, etc.
     title: str = ""
     description: str = ""
@@ -51,20 +52,30 @@ class LearningEntry:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "LearningEntry":
-        """Create from dictionary."""
+        """Create from dictionary.
+
+        Categories and tags come from small sets, so they are interned.
+        Legacy null values are kept as they are.
+        """
+        fromisoformat = datetime.fromisoformat
+        intern = sys.intern
+        category = data["category"]
+        tags = data.get("tags", [])
+        if tags is not None:
+            tags = [intern(tag) for tag in tags]
         last_applied = None
         if data.get("last_applied"):
-            last_applied = datetime.fromisoformat(data["last_applied"])
+            last_applied = fromisoformat(data["last_applied"])
 
         return cls(
             id=data["id"],
-            category=data["category"],
+            category=intern(category) if isinstance(category, str) else category,
             title=data["title"],
             description=data["description"],
             context=data.get("context", ""),
             confidence=data["confidence"],
             frequency=data["frequency"],
             last_applied=last_applied,
-            created_at=datetime.fromisoformat(data["created_at"]),
-            tags=data.get("tags", []),
+            created_at=fromisoformat(data["created_at"]),
+            tags=tags,
         )
@@ -28,7 +28,7 @@ class KnowledgeStore:
             return []
         with open(self.knowledge_file) as f:
             data = json.load(f)
-        return [LearningEntry.from_dict(d) for d in data]
+        return list(map(LearningEntry.from_dict, data))
 
     def _save(self, entries: list[LearningEntry]) -> None:
         """Save all entries to storage."""
@@ -0,0 +1,166 @@
+"""Dependency-graph executor for multi-agent plans.
+
+Schedules a DAG of agent tasks LLMCompiler-style: every node whose
+dependencies are satisfied is launched concurrently, so the plan's
+latency tracks its longest path rather than the sum of all tasks.
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from lloyd.utils.graph import detect_cycles
+
+if TYPE_CHECKING:
+    from lloyd.agents.base import BaseAgent
+
+logger = logging.getLogger(__name__)
+
+# Aggregation callback: (state, node, result) -> new state
+StateUpdater = Callable[[dict[str, Any], "Node", str], dict[str, Any]]
+
+
+class _KeepMissing(dict[str, Any]):
+    """Format mapping that leaves unknown placeholders untouched."""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+@dataclass
+class Node:
+    """A single agent task in a plan.
+
+    Attributes:
+        id: Unique node identifier.
+        agent: Agent that executes the task.
+        task: Task description. May reference upstream results and state
+            entries with ``{node_id}`` placeholders.
+        deps: IDs of nodes that must finish before this one starts.
+    """
+
+    id: str
+    agent: "BaseAgent"
+    task: str
+    deps: list[str] = field(default_factory=list)
+
+
+def default_state_updater(state: dict[str, Any], node: Node, result: str) -> dict[str, Any]:
+    """Record each node's result in the state under its ID.
+
+    Args:
+        state: Current plan state.
+        node: Node that just finished.
+        result: Output of the node.
+
+    Returns:
+        Updated state.
+    """
+    state[node.id] = result
+    return state
+
+
+class PlanExecutor:
+    """Execute a DAG of agent tasks with maximum concurrency.
+
+    Nodes move through ``pending`` -> ``running`` -> ``done``. Whenever a node
+    finishes, the aggregation callback folds its result into the shared
+    state, and any node whose dependencies are all done is launched with
+    its task rendered against that state.
+    """
+
+    def __init__(
+        self,
+        nodes: list[Node],
+        update_state: StateUpdater | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        """Initialize the plan executor.
+
+        Args:
+            nodes: Plan nodes. Dependencies must reference nodes in the plan.
+            update_state: Aggregation callback applied after each node
+                finishes. Defaults to storing results by node ID.
+            timeout: Optional per-node timeout in seconds.
+
+        Raises:
+            ValueError: If a dependency is unknown or the plan has a cycle.
+        """
+        self.nodes = {node.id: node for node in nodes}
+        self.update_state = update_state or default_state_updater
+        self.timeout = timeout
+        self._validate()
+
+    def _validate(self) -> None:
+        """Validate node dependencies."""
+        for node in self.nodes.values():
+            for dep in node.deps:
+                if dep not in self.nodes:
+                    raise ValueError(f"Node '{node.id}' depends on unknown node '{dep}'")
+
+        cycles = detect_cycles(
+            [{"id": node.id, "dependencies": node.deps} for node in self.nodes.values()]
+        )
+        if cycles:
+            raise ValueError(f"Plan has a dependency cycle: {' -> '.join(cycles[0])}")
+
+    @staticmethod
+    def render(task: str, state: dict[str, Any]) -> str:
+        """Render a task description against the current state.
+
+        Args:
+            task: Task template with ``{node_id}`` placeholders.
+            state: Current plan state.
+
+        Returns:
+            Task description with known placeholders filled in.
+        """
+        if "{" not in task:
+            return task
+        try:
+            return task.format_map(_KeepMissing(state))
+        except (ValueError, IndexError):
+            # Literal braces that aren't placeholders - leave as is
+            return task
+
+    async def run(self, state: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Run the plan to completion.
+
+        Args:
+            state: Optional initial state available to task templates.
+
+        Returns:
+            Final state after all nodes have finished.
+        """
+        state = dict(state) if state else {}
+        pending = set(self.nodes)
+        done: set[str] = set()
+        running: dict[asyncio.Task[str], str] = {}
+
+        while pending or running:
+            ready = [nid for nid in pending if set(self.nodes[nid].deps) <= done]
+            for nid in ready:
+                pending.discard(nid)
+                node = self.nodes[nid]
+                task = asyncio.create_task(
+                    node.agent.execute_async(self.render(node.task, state), timeout=self.timeout)
+                )
+                running[task] = nid
+                logger.debug(f"Plan node {nid} started")
+
+            finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                nid = running.pop(task)
+                try:
+                    result = task.result()
+                except BaseException:
+                    for other in running:
+                        other.cancel()
+                    raise
+                state = self.update_state(state, self.nodes[nid], result)
+                done.add(nid)
+                logger.debug(f"Plan node {nid} finished")
+
+        return state
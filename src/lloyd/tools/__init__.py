@@ -56,25 +56,56 @@ TOOL_REGISTRY: dict[str, Any] = {
 }
 
 
-def get_tools_by_names(names: list[str]) -> list[Any]:
-    """Get tool instances by their names.
+# Resolved tools keyed by name tuple. Lookups that fell back to the built-in
+# GitHub tools are not stored, so Composio is retried on the next lookup.
+_tools_cache: dict[tuple[str, ...], tuple[Any, ...]] = {}
+
+
+def _resolve_tools(names: tuple[str, ...]) -> tuple[tuple[Any, ...], bool]:
+    """Resolve tool names against the registry.
 
     Args:
-        names: List of tool names to retrieve.
+        names: Tuple of tool names to retrieve.
 
     Returns:
-        List of tool instances.
+        Tuple of tool instances, and whether the result may be cached.
     """
-    tools = []
+    tools: list[Any] = []
+    cacheable = True
     for name in names:
         if name in TOOL_REGISTRY:
             tool_or_getter = TOOL_REGISTRY[name]
             # Handle tool getters (like github which returns a list)
             if callable(tool_or_getter) and name == "github":
-                tools.extend(tool_or_getter())
+                github_tools = tool_or_getter()
+                # The fallback means Composio had no key or failed this time
+                cacheable = cacheable and github_tools is not GITHUB_TOOLS
+                tools.extend(github_tools)
             else:
                 tools.append(tool_or_getter)
-    return tools
+    return tuple(tools), cacheable
+
+
+def get_tools_by_names(names: list[str]) -> list[Any]:
+    """Get tool instances by their names.
+
+    Lookups are memoized per name tuple, so repeated agent and crew
+    constructions share the same tool instances. A lookup that fell back to
+    the built-in GitHub tools is resolved again next time.
+
+    Args:
+        names: List of tool names to retrieve.
+
+    Returns:
+        List of tool instances.
+    """
+    key = tuple(names)
+    tools = _tools_cache.get(key)
+    if tools is None:
+        tools, cacheable = _resolve_tools(key)
+        if cacheable:
+            _tools_cache[key] = tools
+    return list(tools)
 
 
 def get_all_tools() -> list[Any]:
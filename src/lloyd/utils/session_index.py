@@ -0,0 +1,211 @@
+"""Process-safe index over a directory of per-session JSON files."""
+
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import orjson
+from filelock import FileLock
+
+
+def read_json(path: Path) -> Any:
+    """Read and parse one JSON file.
+
+    Args:
+        path: Path to the JSON file.
+
+    Returns:
+        Parsed JSON data.
+    """
+    return orjson.loads(path.read_bytes())
+
+
+class SessionIndex:
+    """Index mapping session IDs to an entry derived from each session file.
+
+    Sessions live in ``<session_id>.json`` files; the index is an append-only
+    JSON Lines log, ``_index.jsonl``, where each line sets one session's entry
+    or is a ``{"id": ..., "del": true}`` tombstone. Updates hold a file lock
+    while they re-read the log and append to it, so separate processes such
+    as the CLI and the API server never drop each other's changes. Once
+    superseded lines outnumber ``COMPACT_RATIO`` of the live entries, the log
+    is rewritten under the same lock.
+
+    Reads never write: while the log does not exist, entries are derived
+    from the session files in memory, and the first update creates it.
+    Files whose names start with an underscore belong to the index.
+    """
+
+    INDEX_NAME = "_index.jsonl"
+    COMPACT_RATIO = 0.5
+    LOCK_TIMEOUT = 30.0
+
+    # Session files are small and independent, so they are read concurrently
+    MAX_READ_WORKERS = 8
+
+    def __init__(self, directory: Path, entry: Callable[[dict[str, Any]], Any]) -> None:
+        """Initialize the index.
+
+        Args:
+            directory: Directory holding the session files.
+            entry: Derives a session's index entry from its file's data.
+        """
+        self.directory = directory
+        self.path = directory / self.INDEX_NAME
+        self._entry = entry
+        self._lock = FileLock(str(self.path.with_suffix(".lock")), timeout=self.LOCK_TIMEOUT)
+        self._entries: dict[str, Any] | None = None
+        self._records = 0  # Lines in the log, including superseded ones
+        self._file_key: tuple[int, int] | None = None
+
+    def load(self) -> dict[str, Any]:
+        """Get every session's entry.
+
+        The result is cached until the log changes and must not be mutated.
+
+        Returns:
+            Mapping of session ID to entry.
+        """
+        entries = self._read_log()
+        if entries is None:
+            return self._rebuild()
+        return entries
+
+    def update(self, session_id: str, data: dict[str, Any] | None) -> None:
+        """Record a saved session, or remove a deleted one.
+
+        Args:
+            session_id: The session ID.
+            data: The session file's data, or None if it was deleted.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            entries = self._read_log()
+            compact = entries is None
+            if entries is None:
+                entries = self._rebuild()
+
+            # Copy so readers iterating the cached entries are unaffected
+            entries = dict(entries)
+            if data is None:
+                if entries.pop(session_id, None) is None and not compact:
+                    return
+                record: dict[str, Any] = {"id": session_id, "del": True}
+            else:
+                entry = self._entry(data)
+                if not compact and session_id in entries and entries[session_id] == entry:
+                    return
+                entries[session_id] = entry
+                record = {"id": session_id, "entry": entry}
+
+            records = self._records + 1
+            if compact or records - len(entries) > self.COMPACT_RATIO * len(entries):
+                self._compact(entries)
+                return
+            with open(self.path, "ab") as f:
+                f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+            self._entries = entries
+            self._records = records
+            self._file_key = self._stat_key()
+
+    def session_paths(self) -> list[Path]:
+        """List the session files.
+
+        Returns:
+            Paths of all session JSON files.
+        """
+        try:
+            with os.scandir(self.directory) as entries:
+                return [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".json")
+                    and not entry.name.startswith("_")
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return []
+
+    def read_sessions(self) -> list[dict[str, Any]]:
+        """Read every session file, concurrently when there are several.
+
+        Returns:
+            Parsed session data.
+        """
+        paths = self.session_paths()
+        if len(paths) <= 1:
+            return [read_json(path) for path in paths]
+        with ThreadPoolExecutor(max_workers=min(self.MAX_READ_WORKERS, len(paths))) as pool:
+            return list(pool.map(read_json, paths))
+
+    def _stat_key(self) -> tuple[int, int] | None:
+        """Get the log's (mtime_ns, size), or None if it doesn't exist."""
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _read_log(self) -> dict[str, Any] | None:
+        """Replay the log if it changed since it was last read.
+
+        Returns:
+            Mapping of session ID to entry, or None if the log is missing
+            or unreadable.
+        """
+        key = self._stat_key()
+        if key is None:
+            return None
+        if self._entries is not None and key == self._file_key:
+            return self._entries
+
+        entries: dict[str, Any] = {}
+        records = 0
+        try:
+            with open(self.path, "rb") as f:
+                for line in f:
+                    # An unterminated last line is an append still in progress
+                    if not line.endswith(b"\n") or not line.strip():
+                        continue
+                    records += 1
+                    record = orjson.loads(line)
+                    if record.get("del"):
+                        entries.pop(record["id"], None)
+                    else:
+                        entries[record["id"]] = record["entry"]
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return None
+
+        self._entries = entries
+        self._records = records
+        self._file_key = key
+        return entries
+
+    def _rebuild(self) -> dict[str, Any]:
+        """Derive every entry from the session files.
+
+        Returns:
+            Mapping of session ID to entry.
+        """
+        return {data["session_id"]: self._entry(data) for data in self.read_sessions()}
+
+    def _compact(self, entries: dict[str, Any]) -> None:
+        """Atomically rewrite the log with one line per entry.
+
+        Args:
+            entries: Entries to keep.
+        """
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        option = orjson.OPT_APPEND_NEWLINE
+        tmp_path.write_bytes(
+            b"".join(
+                orjson.dumps({"id": session_id, "entry": entry}, option=option)
+                for session_id, entry in entries.items()
+            )
+        )
+        os.replace(tmp_path, self.path)
+        self._entries = entries
+        self._records = len(entries)
+        self._file_key = self._stat_key()
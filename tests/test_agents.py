@@ -0,0 +1,168 @@
+"""Tests for AEGIS agent execution and response caching."""
+
+import asyncio
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from crewai import Agent
+from crewai.llms.base_llm import BaseLLM
+
+from lloyd.agents.base import AgentConfig, BaseAgent, run_parallel
+from lloyd.agents.registry import AGENT_CONFIGS
+from lloyd.utils.cache import SemanticCache
+
+
+class CountingAgent(BaseAgent):
+    """Agent that answers without CrewAI and counts how often it ran."""
+
+    __slots__ = ("runs", "threads", "delay")
+
+    def __init__(
+        self,
+        config: AgentConfig,
+        response_cache: SemanticCache | None = None,
+        delay: float = 0.0,
+    ) -> None:
+        super().__init__(config, response_cache)
+        self.runs: list[str] = []
+        self.threads: list[str] = []
+        self.delay = delay
+
+    def get_tools(self) -> list[Any]:
+        return []
+
+    def _kickoff(self, task_description: str) -> str:
+        self.runs.append(task_description)
+        self.threads.append(threading.current_thread().name)
+        time.sleep(self.delay)
+        return f"result {len(self.runs)}"
+
+
+class EchoLLM(BaseLLM):
+    """LLM that answers with the task it was prompted with."""
+
+    def call(self, messages: Any, *args: Any, **kwargs: Any) -> str:
+        prompt = messages[-1]["content"] if isinstance(messages, list) else messages
+        match = re.search(r"Current Task: (.*)", prompt)
+        return f"Final Answer: done {match.group(1) if match else prompt}"
+
+
+class EchoAgent(BaseAgent):
+    """Agent that runs real CrewAI tasks against an EchoLLM."""
+
+    __slots__ = ("llm",)
+
+    def __init__(self, llm: EchoLLM) -> None:
+        super().__init__(make_config())
+        self.llm = llm
+
+    def get_tools(self) -> list[Any]:
+        return []
+
+    def create_agent(self) -> Agent:
+        if self._agent is None:
+            self._agent = Agent(
+                role=self.role,
+                goal=self.goal,
+                backstory=self.backstory,
+                llm=self.llm,
+                verbose=False,
+            )
+        return self._agent
+
+
+def make_config(cache_responses: bool = False) -> AgentConfig:
+    """Create a minimal agent configuration."""
+    return AgentConfig(
+        role="Tester",
+        goal="Test",
+        backstory="Tests things",
+        verbose=False,
+        cache_responses=cache_responses,
+    )
+
+
+class TestResponseCache:
+    """Tests for BaseAgent response caching."""
+
+    def test_disabled_by_default(self) -> None:
+        """Without cache_responses every call runs the task again."""
+        agent = CountingAgent(make_config())
+
+        assert agent.execute("write the file") == "result 1"
+        assert agent.execute("write the file") == "result 2"
+        assert agent.runs == ["write the file", "write the file"]
+
+    def test_hit_reuses_result(self) -> None:
+        """A repeated prompt is answered from the cache when enabled."""
+        agent = CountingAgent(make_config(cache_responses=True))
+
+        assert agent.execute("summarize", {"doc": "a"}) == "result 1"
+        assert agent.execute("summarize", {"doc": "a"}) == "result 1"
+        assert agent.runs == ["summarize"]
+
+    def test_miss_on_different_context(self) -> None:
+        """Prompts that differ only in context are cached separately."""
+        agent = CountingAgent(make_config(cache_responses=True))
+
+        agent.execute("summarize", {"doc": "a"})
+        agent.execute("summarize", {"doc": "b"})
+
+        assert len(agent.runs) == 2
+
+    def test_shared_cache_hit(self, tmp_path: Path) -> None:
+        """A new agent with the same config reuses results from the shared cache."""
+        shared = SemanticCache(lloyd_dir=tmp_path)
+        CountingAgent(make_config(cache_responses=True), shared).execute("summarize")
+
+        agent = CountingAgent(make_config(cache_responses=True), shared)
+
+        assert agent.execute("summarize") == "result 1"
+        assert agent.runs == []
+
+    @pytest.mark.parametrize(
+        ("kind", "cached"),
+        [("analyst", True), ("researcher", True), ("coder", False), ("tester", False)],
+    )
+    def test_only_read_only_agents_cache(self, kind: str, cached: bool) -> None:
+        """Agents whose tools write files or run commands never cache."""
+        assert AGENT_CONFIGS[kind].cache_responses is cached
+
+
+class TestExecution:
+    """Tests for running tasks through an agent's reused Crew."""
+
+    def test_reused_crew_runs_each_description(self) -> None:
+        """Consecutive tasks on one agent each get their own description."""
+        agent = EchoAgent(EchoLLM(model="echo"))
+
+        assert agent.execute("first task") == "done first task"
+        crew = agent._crew
+        assert agent.execute("second task") == "done second task"
+        assert agent._crew is crew
+
+    def test_run_parallel_keeps_order(self) -> None:
+        """Results follow the input order, including tasks sharing one agent."""
+        shared = EchoAgent(EchoLLM(model="echo"))
+        other = EchoAgent(EchoLLM(model="echo"))
+        pairs = [(shared, "a"), (other, "b"), (shared, "c")]
+
+        assert asyncio.run(run_parallel(pairs)) == ["done a", "done b", "done c"]
+
+    def test_execute_async_uses_agent_pool(self) -> None:
+        """Async execution runs the blocking kickoff on the shared agent pool."""
+        agent = CountingAgent(make_config())
+
+        assert asyncio.run(agent.execute_async("async task")) == "result 1"
+        assert agent.threads[0].startswith("lloyd-agent")
+
+    def test_execute_async_timeout(self) -> None:
+        """A task that outlives its timeout raises TimeoutError."""
+        agent = CountingAgent(make_config(), delay=0.5)
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(agent.execute_async("slow task", timeout=0.05))
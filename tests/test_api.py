@@ -2,7 +2,7 @@
 
 import json
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -24,6 +24,7 @@ def api_key(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
 def client(api_key: str) -> TestClient:
     """Create test client with mocked API key."""
     from lloyd.api import app
+
     return TestClient(app)
 
 
@@ -69,7 +70,9 @@ class TestHealthEndpoints:
 class TestStatusEndpoint:
     """Tests for status endpoint."""
 
-    def test_status_no_prd(self, client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_status_no_prd(
+        self, client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test status when no PRD exists."""
         monkeypatch.chdir(tmp_path)
         response = client.get("/api/status")
@@ -79,6 +82,127 @@ class TestStatusEndpoint:
         assert data["status"] == "idle"
         assert data["total_stories"] == 0
 
+    def test_status_reflects_prd_changes(
+        self, client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test status picks up PRD rewrites despite the parse cache."""
+        monkeypatch.chdir(tmp_path)
+        prd_path = tmp_path / ".lloyd" / "prd.json"
+        prd_path.parent.mkdir(exist_ok=True)
+        prd = {"projectName": "First", "stories": [{"id": "s1", "priority": 1}]}
+        prd_path.write_text(json.dumps(prd))
+
+        assert client.get("/api/status").json()["project_name"] == "First"
+
+        prd["projectName"] = "Second"
+        prd["stories"].append({"id": "s2", "priority": 2, "passes": True})
+        prd_path.write_text(json.dumps(prd))
+
+        data = client.get("/api/status").json()
+        assert data["project_name"] == "Second"
+        assert data["total_stories"] == 2
+        assert data["completed_stories"] == 1
+
+    def test_status_sorts_and_counts_stories(
+        self, client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test stories come back by priority with completion counts."""
+        monkeypatch.chdir(tmp_path)
+        prd_path = tmp_path / ".lloyd" / "prd.json"
+        prd_path.parent.mkdir(exist_ok=True)
+        prd = {
+            "projectName": "Sorted",
+            "stories": [
+                {"id": "c", "priority": 3, "status": "in_progress"},
+                {"id": "x"},
+                {"id": "a", "priority": 1, "passes": True, "status": "completed"},
+            ],
+        }
+        prd_path.write_text(json.dumps(prd))
+
+        for _ in range(2):
+            data = client.get("/api/status").json()
+            assert [s["id"] for s in data["stories"]] == ["a", "c", "x"]
+            assert data["completed_stories"] == 1
+            assert data["in_progress_stories"] == 1
+
+    def test_status_etag_returns_not_modified(
+        self, client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a matching If-None-Match gets 304 until the PRD changes."""
+        monkeypatch.chdir(tmp_path)
+        prd_path = tmp_path / ".lloyd" / "prd.json"
+        prd_path.parent.mkdir(exist_ok=True)
+        prd_path.write_text(json.dumps({"projectName": "Tagged", "stories": []}))
+
+        etag = client.get("/api/status").headers["etag"]
+        response = client.get("/api/status", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        prd_path.write_text(json.dumps({"projectName": "Retagged", "stories": []}))
+        response = client.get("/api/status", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["project_name"] == "Retagged"
+
+
+class TestProgressEndpoint:
+    """Tests for progress endpoint."""
+
+    def test_progress_returns_tail_of_large_log(
+        self, client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test only the end of a large progress log is returned."""
+        from lloyd.api import PROGRESS_TAIL_BYTES
+
+        monkeypatch.chdir(tmp_path)
+        progress_path = tmp_path / ".lloyd" / "progress.txt"
+        progress_path.parent.mkdir(exist_ok=True)
+        lines = [f"line {i:06d}" for i in range(PROGRESS_TAIL_BYTES // 5)]
+        progress_path.write_text("\n".join(lines) + "\n")
+
+        data = client.get("/api/progress").json()
+
+        assert len(data["content"]) <= PROGRESS_TAIL_BYTES
+        assert data["lines"][-1] == lines[-1]
+        assert data["lines"][0] in lines
+
+    def test_progress_picks_up_appended_lines(
+        self, client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test appends are served and a rewritten log replaces the cached tail."""
+        monkeypatch.chdir(tmp_path)
+        progress_path = tmp_path / ".lloyd" / "progress.txt"
+        progress_path.parent.mkdir(exist_ok=True)
+        progress_path.write_text("first\n")
+        assert client.get("/api/progress").json()["lines"] == ["first"]
+
+        with open(progress_path, "a") as f:
+            f.write("second\n")
+        assert client.get("/api/progress").json()["lines"] == ["first", "second"]
+
+        progress_path.write_text("fresh\n")
+        assert client.get("/api/progress").json()["lines"] == ["fresh"]
+
+    def test_progress_read_off_event_loop(
+        self, client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the log tail is read in a worker thread, not on the event loop."""
+        import asyncio
+
+        monkeypatch.chdir(tmp_path)
+        progress_path = tmp_path / ".lloyd" / "progress.txt"
+        progress_path.parent.mkdir(exist_ok=True)
+        progress_path.write_text("line\n")
+
+        def read_tail(path: Path) -> tuple[str, list[str]]:
+            with pytest.raises(RuntimeError):
+                asyncio.get_running_loop()
+            return "line\n", ["line"]
+
+        monkeypatch.setattr("lloyd.api._read_progress_tail", read_tail)
+
+        assert client.get("/api/progress").json()["lines"] == ["line"]
+
 
 class TestAuthenticationRequired:
     """Tests for authentication on protected endpoints."""
@@ -130,7 +254,30 @@ class TestAuthenticatedEndpoints:
         data = response.json()
         assert data["queued"] is True
 
-    def test_init_with_auth(self, client: TestClient, auth_headers: dict[str, str], tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_idea_starts_execution(self, client: TestClient, auth_headers: dict[str, str]) -> None:
+        """A non-queue idea creates a flow and starts it in the background."""
+        with (
+            patch("lloyd.api.LloydFlow") as flow_cls,
+            patch("lloyd.api.run_workflow_async", new_callable=AsyncMock) as run,
+        ):
+            response = client.post(
+                "/api/idea",
+                json={"description": "test idea", "sequential": True},
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 200
+        assert response.json()["parallel"] is False
+        assert flow_cls.return_value.state.parallel_mode is False
+        run.assert_called_once_with(flow_cls.return_value, 50, False)
+
+    def test_init_with_auth(
+        self,
+        client: TestClient,
+        auth_headers: dict[str, str],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """Test project initialization with authentication."""
         monkeypatch.chdir(tmp_path)
         response = client.post("/api/init", headers=auth_headers)
@@ -203,6 +350,21 @@ class TestBrainstormEndpoints:
         response = client.get("/api/brainstorm")
         assert response.status_code == 200
 
+    def test_brainstorm_store_dependency_override(self, client: TestClient, tmp_path: Path) -> None:
+        """Test handlers use the store provided through the dependency."""
+        from lloyd.api import app, get_brainstorm_store
+        from lloyd.brainstorm.session import BrainstormSession, BrainstormStore
+
+        store = BrainstormStore(tmp_path)
+        store.save(BrainstormSession(session_id="abc12345", initial_idea="idea"))
+        app.dependency_overrides[get_brainstorm_store] = lambda: store
+        try:
+            response = client.get("/api/brainstorm")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert [s["session_id"] for s in response.json()] == ["abc12345"]
+
 
 class TestExtensionsEndpoints:
     """Tests for extensions endpoints."""
@@ -220,3 +382,263 @@ class TestSelfModEndpoints:
         """Test getting self-mod queue."""
         response = client.get("/api/selfmod/queue")
         assert response.status_code == 200
+
+
+class FakeWebSocket:
+    """Minimal WebSocket stand-in for ConnectionManager tests."""
+
+    def __init__(self, fail: bool = False, block: bool = False) -> None:
+        self.fail = fail
+        self.block = block
+        self.sent: list[str] = []
+        self.closed_code: int | None = None
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        import asyncio
+
+        if self.fail:
+            raise RuntimeError("connection lost")
+        if self.block:
+            await asyncio.Event().wait()
+        self.sent.append(data)
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        self.closed_code = code
+
+
+class TestConnectionManager:
+    """Tests for WebSocket broadcast fan-out."""
+
+    def test_broadcast_sends_same_payload_to_all(self) -> None:
+        """Test every client receives the serialized message."""
+        import asyncio
+
+        from lloyd.api import ConnectionManager
+
+        mgr = ConnectionManager()
+        sockets = [FakeWebSocket() for _ in range(3)]
+
+        async def run() -> None:
+            for ws in sockets:
+                await mgr.connect(ws)
+            await mgr.broadcast({"type": "status", "n": 1})
+            await mgr.flush()
+
+        asyncio.run(run())
+
+        assert all(json.loads(ws.sent[0]) == {"type": "status", "n": 1} for ws in sockets)
+
+    def test_broadcast_serializes_once(self) -> None:
+        """Test the message is encoded once however many clients are connected."""
+        import asyncio
+
+        import orjson
+
+        from lloyd.api import ConnectionManager
+
+        mgr = ConnectionManager()
+        sockets = [FakeWebSocket() for _ in range(5)]
+
+        async def run() -> None:
+            for ws in sockets:
+                await mgr.connect(ws)
+            with patch("lloyd.api.orjson.dumps", wraps=orjson.dumps) as dumps:
+                await mgr.broadcast({"type": "status"})
+                await mgr.flush()
+            assert dumps.call_count == 1
+
+        asyncio.run(run())
+
+        assert {ws.sent[0] for ws in sockets} == {'{"type":"status"}'}
+
+    def test_broadcast_does_not_wait_for_clients(self) -> None:
+        """Test broadcast returns while a client's send is still pending."""
+        import asyncio
+
+        from lloyd.api import ConnectionManager
+
+        mgr = ConnectionManager()
+        stalled, ok = FakeWebSocket(block=True), FakeWebSocket()
+
+        async def run() -> None:
+            await mgr.connect(stalled)
+            await mgr.connect(ok)
+            await mgr.broadcast({"n": 1})
+            await asyncio.sleep(0)
+            await asyncio.wait_for(mgr.broadcast({"n": 2}), timeout=1)
+            await asyncio.sleep(0)
+
+        asyncio.run(run())
+
+        assert [json.loads(m)["n"] for m in ok.sent] == [1, 2]
+        assert stalled.sent == []
+
+    def test_broadcast_drops_failed_connections(self) -> None:
+        """Test connections that fail to send are pruned."""
+        import asyncio
+
+        from lloyd.api import ConnectionManager
+
+        mgr = ConnectionManager()
+        good, bad = FakeWebSocket(), FakeWebSocket(fail=True)
+
+        async def run() -> None:
+            await mgr.connect(good)
+            await mgr.connect(bad)
+            await mgr.broadcast({"type": "ping"})
+            await mgr.flush()
+            assert set(mgr.active_connections) == {good}
+
+        asyncio.run(run())
+
+        assert len(good.sent) == 1
+
+    def test_slow_client_does_not_block_others(self) -> None:
+        """Test a stalled client is closed on overflow while others keep receiving."""
+        import asyncio
+
+        from lloyd.api import ConnectionManager
+
+        mgr = ConnectionManager()
+        mgr.SEND_QUEUE_SIZE = 2
+        fast, slow = FakeWebSocket(), FakeWebSocket(block=True)
+
+        async def run() -> None:
+            await mgr.connect(fast)
+            await mgr.connect(slow)
+            for n in range(5):
+                await mgr.broadcast({"n": n})
+                await asyncio.sleep(0)
+            await mgr.flush()
+            assert set(mgr.active_connections) == {fast}
+
+        asyncio.run(run())
+
+        assert [json.loads(m)["n"] for m in fast.sent] == [0, 1, 2, 3, 4]
+
+
+class TestWorkflowStatusUpdates:
+    """Tests for status updates broadcast by the workflow loop."""
+
+    def test_status_update_uses_in_memory_prd(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test stories are taken from the flow's PRD without re-reading disk."""
+        import asyncio
+        from types import SimpleNamespace
+
+        from lloyd.api import ConnectionManager, run_workflow_async
+        from lloyd.memory.prd_manager import PRD, Story, StoryStatus
+
+        monkeypatch.chdir(tmp_path)
+        prd = PRD(
+            project_name="test",
+            stories=[
+                Story(id="1", title="A", description="a", status=StoryStatus.IN_PROGRESS),
+                Story(id="2", title="B", description="b"),
+            ],
+        )
+        state = SimpleNamespace(
+            max_iterations=1, iteration=0, status="in_progress", can_continue=lambda: True
+        )
+
+        def run_iteration() -> bool:
+            state.iteration += 1
+            return False
+
+        flow = SimpleNamespace(
+            state=state,
+            prd=prd,
+            decompose_idea=lambda: None,
+            run_iteration=run_iteration,
+        )
+        mgr = ConnectionManager()
+        ws = FakeWebSocket()
+        monkeypatch.setattr("lloyd.api.manager", mgr)
+
+        async def run() -> None:
+            await mgr.connect(ws)
+            await run_workflow_async(flow, max_iterations=1, parallel=False)
+            await mgr.flush()
+
+        asyncio.run(run())
+
+        updates = [m for m in map(json.loads, ws.sent) if m["type"] == "status_update"]
+        assert len(updates) == 1
+        assert updates[0]["in_progress"] == 1
+        assert [s["id"] for s in updates[0]["stories"]] == ["1", "2"]
+        assert updates[0]["stories"][0]["acceptanceCriteria"] == []
+
+    def test_status_updates_are_coalesced(self) -> None:
+        """Test rapid updates collapse to the first and the latest."""
+        import asyncio
+
+        from lloyd.api import CoalescingBroadcaster, ConnectionManager
+
+        mgr = ConnectionManager()
+        ws = FakeWebSocket()
+
+        async def run() -> None:
+            await mgr.connect(ws)
+            updates = CoalescingBroadcaster(mgr, interval=60)
+            for n in range(5):
+                updates.publish({"n": n})
+                await asyncio.sleep(0)
+            await updates.close()
+            await mgr.flush()
+
+        asyncio.run(run())
+
+        assert [json.loads(m)["n"] for m in ws.sent] == [0, 4]
+
+
+class TestResetStory:
+    """Tests for resetting a story in the PRD."""
+
+    def test_failed_write_leaves_cached_prd_unchanged(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a reset that cannot be saved is not visible to PRD readers."""
+        from lloyd.api import _load_prd, _reset_story_in_prd
+
+        prd_path = tmp_path / "prd.json"
+        story = {"id": "1", "passes": True, "attempts": 2, "notes": "done"}
+        prd_path.write_text(json.dumps({"stories": [story]}))
+        assert _load_prd(prd_path)["stories"][0]["passes"] is True
+
+        def fail_write(self: Path, data: bytes) -> int:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(Path, "write_bytes", fail_write)
+        with pytest.raises(OSError):
+            _reset_story_in_prd(prd_path, "1")
+
+        assert _load_prd(prd_path)["stories"][0] == story
+
+    def test_reset_is_saved(self, tmp_path: Path) -> None:
+        """Test a reset story is written back and re-read."""
+        from lloyd.api import _load_prd, _reset_story_in_prd
+
+        prd_path = tmp_path / "prd.json"
+        prd_path.write_text(json.dumps({"stories": [{"id": "1", "passes": True}]}))
+
+        assert _reset_story_in_prd(prd_path, "1") is True
+        assert _reset_story_in_prd(prd_path, "missing") is False
+        assert _load_prd(prd_path)["stories"][0]["passes"] is False
+
+
+class TestStartServer:
+    """Tests for the server entry point."""
+
+    def test_banner_logged(self, api_key: str, caplog: pytest.LogCaptureFixture) -> None:
+        """Test the startup banner with the API key goes through the logger."""
+        from lloyd.api import start_server
+
+        with patch("lloyd.api.uvicorn.run") as run, caplog.at_level("INFO", logger="lloyd.api"):
+            start_server()
+
+        run.assert_called_once()
+        assert any(api_key in r.getMessage() for r in caplog.records)
@@ -0,0 +1,69 @@
+"""Tests for BrainstormStore."""
+
+from pathlib import Path
+
+import pytest
+
+from lloyd.brainstorm.session import BrainstormSession, BrainstormStore
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> BrainstormStore:
+    """Create a store in a temporary directory."""
+    return BrainstormStore(tmp_path)
+
+
+class TestBrainstormStoreIndex:
+    """Tests for the session index behind list_all."""
+
+    def test_list_all_reflects_saves_and_deletes(self, store: BrainstormStore) -> None:
+        """Saved sessions are listed, updated in place, and removed on delete."""
+        first = BrainstormSession(initial_idea="first")
+        second = BrainstormSession(initial_idea="second")
+        store.save(first)
+        store.save(second)
+
+        first.add_clarification("Who?", "Everyone")
+        store.save(first)
+        store.delete(second.session_id)
+
+        sessions = store.list_all()
+        assert [s.session_id for s in sessions] == [first.session_id]
+        assert sessions[0].clarifications == [{"question": "Who?", "answer": "Everyone"}]
+        assert store.list_sessions() == [first.session_id]
+
+    def test_missing_index_derived_without_writing(self, store: BrainstormStore) -> None:
+        """Without an index, listing reads the session files and writes nothing."""
+        sessions = [BrainstormSession(initial_idea=str(i)) for i in range(3)]
+        for session in sessions:
+            store.save(session)
+        store.index.path.unlink()
+
+        fresh = BrainstormStore(store.lloyd_dir)
+        listed = fresh.list_all()
+
+        assert sorted(s.initial_idea for s in listed) == ["0", "1", "2"]
+        assert not store.index.path.exists()
+
+        fresh.save(BrainstormSession(initial_idea="3"))
+        assert len(BrainstormStore(store.lloyd_dir).list_all()) == 4
+
+    def test_separate_stores_keep_all_updates(self, store: BrainstormStore) -> None:
+        """Writers that each cached the index do not drop each other's sessions."""
+        other = BrainstormStore(store.lloyd_dir)
+        store.save(BrainstormSession(initial_idea="mine"))
+        other.list_all()
+
+        other.save(BrainstormSession(initial_idea="theirs"))
+        store.save(BrainstormSession(initial_idea="mine again"))
+
+        listed = BrainstormStore(store.lloyd_dir).list_all()
+        assert sorted(s.initial_idea for s in listed) == ["mine", "mine again", "theirs"]
+
+    def test_get_reads_session_file(self, store: BrainstormStore) -> None:
+        """get() returns the stored session, and None for unknown IDs."""
+        session = BrainstormSession(initial_idea="idea")
+        store.save(session)
+
+        assert store.get(session.session_id).initial_idea == "idea"
+        assert store.get("missing") is None
@@ -0,0 +1,98 @@
+"""Tests for Lloyd configuration helpers."""
+
+import httpx
+import pytest
+
+from lloyd.config import (
+    _PROVIDER_CLASS_CACHE,
+    LLMHealthChecker,
+    get_llm_client,
+    get_settings,
+)
+
+
+def make_checker(status_code: int = 200, cache_ttl: float = 5.0) -> tuple[LLMHealthChecker, list]:
+    """Create a checker whose HTTP client answers /api/tags from memory."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        models = [{"name": "qwen2.5:32b", "size": 2 * 1024**3}]
+        return httpx.Response(status_code, json={"models": models})
+
+    checker = LLMHealthChecker("http://ollama.test", cache_ttl=cache_ttl)
+    checker._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return checker, requests
+
+
+class TestLLMHealthChecker:
+    """Tests for LLMHealthChecker."""
+
+    def test_checks_share_one_tags_request(self) -> None:
+        """Liveness and model checks are answered from one snapshot."""
+        checker, requests = make_checker()
+
+        assert checker.check_ollama_sync() == (True, "1 models: qwen2.5:32b")
+        assert checker.check_model_available("qwen2.5:32b") == (True, "Model loaded (2.0GB)")
+        assert checker.check_model_available("llama3") == (False, "Model 'llama3' not found")
+        assert checker.quick_check() is True
+        assert len(requests) == 1
+
+    def test_snapshot_expires(self) -> None:
+        """A zero TTL refetches on every check."""
+        checker, requests = make_checker(cache_ttl=0)
+
+        checker.quick_check()
+        checker.quick_check()
+
+        assert len(requests) == 2
+
+    def test_http_error_reported(self) -> None:
+        """Non-200 responses mark Ollama unavailable."""
+        checker, _ = make_checker(status_code=500)
+
+        assert checker.check_ollama_sync() == (False, "HTTP 500")
+        assert checker.check_model_available("qwen2.5:32b") == (False, "HTTP 500")
+
+
+class TestGetSettings:
+    """Tests for get_settings."""
+
+    def test_settings_loaded_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Settings are cached until the cache is cleared."""
+        get_settings.cache_clear()
+        monkeypatch.setenv("LLOYD_MAX_ITERATIONS", "7")
+        settings = get_settings()
+
+        monkeypatch.setenv("LLOYD_MAX_ITERATIONS", "9")
+        assert get_settings() is settings
+
+        get_settings.cache_clear()
+        assert get_settings().max_iterations == 9
+        get_settings.cache_clear()
+
+
+class TestGetLLMClient:
+    """Tests for get_llm_client."""
+
+    def test_client_shared_per_configuration(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The same configuration reuses one client; a new host builds another."""
+        monkeypatch.setenv("LLOYD_LLM", "ollama/qwen2.5:32b")
+        monkeypatch.setenv("OLLAMA_HOST", "http://one.test:11434")
+        client = get_llm_client()
+
+        assert get_llm_client() is client
+        assert client.model == "qwen2.5:32b"
+
+        monkeypatch.setenv("OLLAMA_HOST", "http://two.test:11434")
+        assert get_llm_client() is not client
+
+    def test_unknown_provider_uses_cached_ollama_class(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Unknown providers fall back to Ollama with the full model string."""
+        monkeypatch.setenv("LLOYD_LLM", "custom/model")
+        client = get_llm_client()
+
+        assert client.model == "custom/model"
+        assert type(client) is _PROVIDER_CLASS_CACHE["ollama"]
@@ -0,0 +1,133 @@
+"""Tests for Lloyd crew configuration loading."""
+
+from pathlib import Path
+
+import pytest
+
+from lloyd.crews import ExecutionCrew, PlanningCrew, QualityCrew
+from lloyd.crews._config import (
+    compile_task_descriptions,
+    format_bullets,
+    format_description,
+    load_config,
+    truncate,
+)
+
+
+class TestCrewConfig:
+    """Tests for crew YAML config loading."""
+
+    def test_load_config_parses_utf8(self, tmp_path: Path) -> None:
+        """Config files are parsed as UTF-8 YAML."""
+        path = tmp_path / "tasks.yaml"
+        path.write_text('task:\n  description: "Résumé — {story_title}"\n', encoding="utf-8")
+
+        assert load_config(path) == {"task": {"description": "Résumé — {story_title}"}}
+
+    def test_crews_load_bundled_configs(self) -> None:
+        """Each crew loads its agents and tasks configs."""
+        for crew_class in (ExecutionCrew, PlanningCrew, QualityCrew):
+            crew = crew_class()
+            assert crew.agents_config
+            assert crew.tasks_config
+
+    def test_load_config_returns_own_copy(self, tmp_path: Path) -> None:
+        """Compiling one load in place leaves later loads of the file untouched."""
+        path = tmp_path / "tasks.yaml"
+        path.write_text('task:\n  description: "{idea}"\n', encoding="utf-8")
+
+        compile_task_descriptions(load_config(path))
+
+        assert load_config(path) == {"task": {"description": "{idea}"}}
+
+
+class TestTaskDescriptions:
+    """Tests for pre-parsed task description templates."""
+
+    def test_parsed_description_matches_format(self) -> None:
+        """Plain fields are filled from the parsed template like str.format."""
+        tasks = compile_task_descriptions(
+            {"review": {"description": "Review {story_title} ({{draft}}):\n{criteria}"}}
+        )
+        inputs = {"story_title": "Login", "criteria": "- works", "unused": 1}
+
+        assert tasks["review"]["_description_parsed"] is not None
+        assert format_description(tasks["review"], inputs) == (
+            tasks["review"]["description"].format(**inputs)
+        )
+
+    def test_format_spec_falls_back_to_str_format(self) -> None:
+        """Templates with format specs are not pre-parsed."""
+        tasks = compile_task_descriptions({"t": {"description": "Score: {score:.1f}"}})
+
+        assert tasks["t"]["_description_parsed"] is None
+        assert format_description(tasks["t"], {"score": 0.25}) == "Score: 0.2"
+
+    def test_format_bullets(self) -> None:
+        """Items render as one markdown bullet per line."""
+        assert format_bullets(["a", "b"]) == "- a\n- b"
+        assert format_bullets([]) == ""
+
+    def test_truncate_prefers_raw_output(self) -> None:
+        """Crew outputs are truncated from their raw text without str()."""
+
+        class Output:
+            raw = "abcdef"
+
+            def __str__(self) -> str:
+                raise AssertionError("str() should not be called")
+
+        assert truncate(Output(), 3) == "abc"
+        assert truncate("abcdef", 2) == "ab"
+        assert truncate(12345, 3) == "123"
+
+    def test_missing_field_raises(self) -> None:
+        """Missing inputs raise KeyError, as with str.format."""
+        tasks = compile_task_descriptions({"t": {"description": "{idea}"}})
+
+        with pytest.raises(KeyError):
+            format_description(tasks["t"], {})
+
+
+class TestBaseCrew:
+    """Tests for the shared crew base class."""
+
+    def test_configs_loaded_once_per_class(self) -> None:
+        """Instances share their class's parsed configs."""
+        assert ExecutionCrew().tasks_config is ExecutionCrew().tasks_config
+        assert PlanningCrew.agents_config is not QualityCrew.agents_config
+
+    def test_create_crew_reuses_agents(self) -> None:
+        """Agents are created once per crew instance and shared by its tasks."""
+        crew = QualityCrew()
+        inputs = {"story": {"title": "Login"}, "acceptance_criteria": ["works"]}
+
+        first = crew.create_crew(inputs)
+        second = crew.create_crew(inputs)
+
+        assert [t.agent for t in first.tasks] == [t.agent for t in second.tasks]
+        assert "Login" in first.tasks[0].description
+        assert len(second.agents) == len(crew._agents)
+
+    @pytest.mark.parametrize(
+        ("output", "passes"),
+        [
+            ("Verdict -- PASSES: TRUE", True),
+            ("All criteria met.", True),
+            ("All criteria met, but one test failed", False),
+            ("passes: false", False),
+        ],
+    )
+    def test_quality_verdict(
+        self, monkeypatch: pytest.MonkeyPatch, output: str, passes: bool
+    ) -> None:
+        """QualityCrew.kickoff derives the verdict from the crew output."""
+        crew = QualityCrew()
+
+        class FakeCrew:
+            def kickoff(self) -> str:
+                return output
+
+        monkeypatch.setattr(crew, "create_crew", lambda inputs: FakeCrew())
+
+        assert crew.kickoff({}) == {"passes": passes, "details": output}
@@ -0,0 +1,103 @@
+"""Tests for the Lloyd debug feedback loop."""
+
+from pathlib import Path
+
+import pytest
+
+from lloyd.debug import DebugSession, DebugStore
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> DebugStore:
+    """Create a store in a temporary directory."""
+    return DebugStore(tmp_path)
+
+
+def make_session(session_id: str) -> DebugSession:
+    """Create a session with one attempt."""
+    session = DebugSession(session_id=session_id, project_id="proj", original_issue="crash")
+    session.add_attempt("restart", "still crashes")
+    return session
+
+
+class TestDebugStore:
+    """Tests for DebugStore."""
+
+    def test_save_and_get_round_trip(self, store: DebugStore) -> None:
+        """A saved session is read back with its attempts and timestamps."""
+        session = make_session("s1")
+        session.record_feedback("no_effect")
+        store.save(session)
+
+        loaded = store.get("s1")
+
+        assert loaded == session
+        assert store.get("missing") is None
+
+    def test_list_active_and_all(self, store: DebugStore) -> None:
+        """Only in-progress sessions are listed as active."""
+        store.save(make_session("open"))
+        resolved = make_session("done")
+        resolved.record_feedback("fixed")
+        store.save(resolved)
+
+        assert store.list_active() == ["open"]
+        assert sorted(s.session_id for s in store.list_all()) == ["done", "open"]
+        assert store.delete("done") is True
+        assert store.delete("done") is False
+
+    def test_list_all_reads_many_sessions(self, store: DebugStore) -> None:
+        """list_all returns every session when files are read concurrently."""
+        for i in range(20):
+            store.save(make_session(f"s{i}"))
+
+        sessions = store.list_all()
+
+        assert sorted(s.session_id for s in sessions) == sorted(f"s{i}" for i in range(20))
+        assert all(s.attempts[0].approach == "restart" for s in sessions)
+
+    def test_status_index_tracks_saves(self, store: DebugStore) -> None:
+        """list_active follows status changes without reading session files."""
+        session = make_session("s1")
+        store.save(session)
+        assert store.list_active() == ["s1"]
+
+        session.record_feedback("fixed")
+        store.save(session)
+        store._session_path("s1").write_bytes(b"not json")
+
+        assert store.list_active() == []
+
+    def test_missing_index_derived_without_writing(self, store: DebugStore) -> None:
+        """Without an index, statuses come from the session files and nothing is written."""
+        store.save(make_session("a"))
+        store.save(make_session("b"))
+        store.index.path.unlink()
+
+        fresh = DebugStore(store.lloyd_dir)
+
+        assert sorted(fresh.list_active()) == ["a", "b"]
+        assert not store.index.path.exists()
+        assert len(fresh.list_all()) == 2
+
+
+class TestDebugModels:
+    """Tests for debug model serialization."""
+
+    def test_repeated_loads_share_parsed_timestamps(self) -> None:
+        """Loading the same data twice reuses the parsed datetimes."""
+        data = make_session("s1").to_dict()
+
+        first = DebugSession.from_dict(data)
+        second = DebugSession.from_dict(data)
+
+        assert first == second
+        assert first.created_at is second.created_at
+        assert first.attempts[0].timestamp is second.attempts[0].timestamp
+
+    def test_models_have_no_instance_dict(self) -> None:
+        """Debug models use slots instead of per-instance dicts."""
+        session = make_session("s1")
+
+        assert not hasattr(session, "__dict__")
+        assert not hasattr(session.attempts[0], "__dict__")
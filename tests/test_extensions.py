@@ -0,0 +1,256 @@
+"""Tests for Lloyd extension base classes."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from lloyd.extensions import ExtensionManager, ExtensionTool, tool_method
+from lloyd.extensions.builder import (
+    extract_purpose,
+    extract_service_name,
+    generate_config_requirements,
+    generate_smart_tool,
+)
+from lloyd.extensions.scaffold import create_extension_scaffold
+
+
+class GreeterTool(ExtensionTool):
+    """Extension with two tool methods and a helper."""
+
+    name = "greeter"
+
+    @tool_method
+    def greet(self, who: str) -> str:
+        """Greet someone."""
+        return f"Hello, {who}"
+
+    @tool_method
+    def count(self) -> int:
+        """Count something."""
+        return len(self.config)
+
+    def helper(self) -> None:
+        """Not exposed as a tool."""
+
+
+class LoudGreeterTool(GreeterTool):
+    """Subclass that inherits one tool method and hides another."""
+
+    @tool_method
+    def shout(self, who: str) -> str:
+        """Shout at someone."""
+        return self.greet(who).upper()
+
+    def count(self) -> int:
+        """Plain override without @tool_method."""
+        return 0
+
+
+class TestExtensionTool:
+    """Tests for ExtensionTool tool method discovery."""
+
+    def test_get_tool_methods(self) -> None:
+        """Only decorated methods are listed, bound to the instance."""
+        tool = GreeterTool({"a": 1})
+
+        methods = {m["name"]: m for m in tool.get_tool_methods()}
+
+        assert sorted(methods) == ["count", "greet"]
+        assert methods["greet"]["description"] == "Greet someone."
+        assert methods["greet"]["method"]("Ada") == "Hello, Ada"
+        assert methods["count"]["method"]() == 1
+
+    def test_subclass_inherits_and_overrides(self) -> None:
+        """Inherited tool methods are kept unless overridden undecorated."""
+        names = [m["name"] for m in LoudGreeterTool().get_tool_methods()]
+
+        assert names == ["greet", "shout"]
+
+    def test_tool_method_returns_function_unwrapped(self) -> None:
+        """The decorator marks the function itself instead of wrapping it."""
+
+        def probe() -> None:
+            """Probe."""
+
+        assert tool_method(probe) is probe
+        assert probe._is_tool_method is True
+
+
+@pytest.fixture
+def lloyd_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Run in a temporary directory, where scaffolds create .lloyd/extensions."""
+    monkeypatch.chdir(tmp_path)
+    return Path(".lloyd")
+
+
+class TestExtensionManager:
+    """Tests for extension discovery and loading."""
+
+    def test_discover_loads_scaffolded_extension(self, lloyd_dir: Path) -> None:
+        """A scaffolded extension is discovered with its manifest and tool."""
+        create_extension_scaffold("echo-tool", "Echo things")
+
+        manager = ExtensionManager(lloyd_dir)
+        (ext,) = manager.discover()
+
+        assert (ext.name, ext.version, ext.description) == ("echo-tool", "0.1.0", "Echo things")
+        assert ext.error is None
+        assert [m["name"] for m in ext.tool_instance.get_tool_methods()] == ["main_action"]
+        assert manager.get_enabled_tools() == [ext.tool_instance]
+
+    def test_discover_reuses_unchanged_extensions(self, lloyd_dir: Path) -> None:
+        """Rediscovery reloads only extensions whose files changed."""
+        create_extension_scaffold("kept")
+        changed_dir = create_extension_scaffold("changed")
+        manager = ExtensionManager(lloyd_dir)
+        first = {ext.name: ext for ext in manager.discover()}
+
+        tool_path = changed_dir / "tool.py"
+        tool_path.write_text(tool_path.read_text().replace("Result:", "Changed result:"))
+        second = {ext.name: ext for ext in manager.discover()}
+
+        assert second["kept"] is first["kept"]
+        assert second["changed"] is not first["changed"]
+        assert second["changed"].tool_instance.main_action("x") == "Changed result: x"
+
+    def test_discover_loads_many_with_errors(self, lloyd_dir: Path) -> None:
+        """Concurrent loading keeps directory order and reports broken manifests."""
+        for name in ("a", "b", "c"):
+            create_extension_scaffold(name)
+        broken = create_extension_scaffold("d")
+        (broken / "manifest.yaml").write_text("name: [unclosed\n")
+        manager = ExtensionManager(lloyd_dir)
+
+        found = manager.discover()
+
+        expected = [p.name for p in manager.extensions_dir.iterdir()]
+        assert [ext.path.name for ext in found] == expected
+        assert [ext.name for ext in found if not ext.enabled] == ["d"]
+        assert sorted(manager.extensions) == ["a", "b", "c"]
+
+    def test_tool_loaded_on_first_use(self, lloyd_dir: Path) -> None:
+        """Discovery does not execute tool modules; failures surface on first use."""
+        ext_dir = create_extension_scaffold("broken")
+        (ext_dir / "tool.py").write_text("raise RuntimeError('boom')\n")
+        manager = ExtensionManager(lloyd_dir)
+
+        (ext,) = manager.discover()
+        assert ext.enabled and ext.error is None and ext.has_tool
+
+        assert manager.get_enabled_tools() == []
+        assert not ext.enabled
+        assert ext.error == "boom"
+        assert ext.to_dict()["has_tool"] is False
+
+
+class TestExtensionBuilder:
+    """Tests for building extensions from ideas."""
+
+    @pytest.mark.parametrize(
+        ("idea", "purpose"),
+        [
+            ("Connect my Notion workspace", "my notion workspace"),
+            ("Build something so I can track habits", "track habits"),
+            ("I want to log my runs. Daily.", "log my runs"),
+            ("Weather dashboard", "Weather dashboard"),
+        ],
+    )
+    def test_extract_purpose(self, idea: str, purpose: str) -> None:
+        """The first matching purpose pattern wins; otherwise the idea is used."""
+        assert extract_purpose(idea) == purpose
+
+    def test_extract_service_name(self) -> None:
+        """Known services are recognised case-insensitively."""
+        assert extract_service_name("Post to SLACK daily") == "Slack"
+        assert extract_service_name("Sync my calendar into Notion") == "Notion"
+        assert extract_service_name("Track my habits") is None
+
+    def test_config_requirements_written_to_manifest(self, lloyd_dir: Path) -> None:
+        """Service config requirements are added to the manifest."""
+        ext_dir = create_extension_scaffold("github-sync")
+
+        generate_config_requirements(ext_dir, "Github")
+
+        manifest = yaml.safe_load((ext_dir / "manifest.yaml").read_text())
+        assert manifest["name"] == "github-sync"
+        assert [r["key"] for r in manifest["requires"]["config"]] == ["GITHUB_TOKEN"]
+        assert not list(ext_dir.glob("*.tmp"))
+
+    def test_unknown_service_needs_no_config(self, lloyd_dir: Path) -> None:
+        """Services without known requirements get an empty config list."""
+        ext_dir = create_extension_scaffold("custom")
+
+        generate_config_requirements(ext_dir, "Trello")
+
+        manifest = yaml.safe_load((ext_dir / "manifest.yaml").read_text())
+        assert manifest["requires"] == {"config": []}
+
+    @pytest.mark.parametrize(
+        ("service", "methods"),
+        [
+            ("Notion", ["query_notion", "sync_to_notion"]),
+            ("Spotify", ["pause", "play", "search"]),
+            ("Slack", ["send_message"]),
+            (None, ["main_action"]),
+        ],
+    )
+    def test_generated_tool_loads(
+        self, lloyd_dir: Path, service: str | None, methods: list[str]
+    ) -> None:
+        """Generated tool.py files load as extensions exposing the service's methods."""
+        ext_dir = create_extension_scaffold("generated")
+        generate_smart_tool(ext_dir, service, "keep {braces}", "an idea")
+
+        (ext,) = ExtensionManager(lloyd_dir).discover()
+
+        assert ext.error is None
+        assert [m["name"] for m in ext.tool_instance.get_tool_methods()] == methods
+        assert "Purpose: keep {braces}" in (ext_dir / "tool.py").read_text()
+
+    def test_first_defined_tool_class_used(self, lloyd_dir: Path) -> None:
+        """The module's first ExtensionTool subclass is its tool, not the base class."""
+        ext_dir = create_extension_scaffold("pair")
+        (ext_dir / "tool.py").write_text(
+            "from lloyd.extensions import ExtensionTool\n"
+            "class ZetaTool(ExtensionTool):\n"
+            "    name = 'zeta'\n"
+            "class AlphaTool(ZetaTool):\n"
+            "    name = 'alpha'\n"
+        )
+
+        (ext,) = ExtensionManager(lloyd_dir).discover()
+
+        assert ext.tool_instance.name == "zeta"
+
+    def test_legacy_tool_class_attribute(self, lloyd_dir: Path) -> None:
+        """A module that imports its tool class can name it with TOOL_CLASS."""
+        ext_dir = create_extension_scaffold("legacy")
+        (ext_dir / "tool.py").write_text(
+            "from tests.test_extensions import GreeterTool as TOOL_CLASS\n"
+        )
+
+        (ext,) = ExtensionManager(lloyd_dir).discover()
+
+        assert type(ext.tool_instance) is GreeterTool
+
+    def test_tool_module_executed_once_per_version(self, lloyd_dir: Path) -> None:
+        """Other managers reuse the executed tool class until the file changes."""
+        ext_dir = create_extension_scaffold("counted")
+        tool_path = ext_dir / "tool.py"
+        (lloyd_dir / "runs.txt").write_text("")
+        tool_path.write_text(
+            "from pathlib import Path\n"
+            "runs = Path('.lloyd/runs.txt')\n"
+            "runs.write_text(runs.read_text() + 'x')\n" + tool_path.read_text()
+        )
+
+        first = ExtensionManager(lloyd_dir).discover()[0].tool_instance
+        second = ExtensionManager(lloyd_dir).discover()[0].tool_instance
+        assert type(second) is type(first) and second is not first
+        assert (lloyd_dir / "runs.txt").read_text() == "x"
+
+        tool_path.write_text(tool_path.read_text() + "\n# changed\n")
+        third = ExtensionManager(lloyd_dir).discover()[0].tool_instance
+        assert type(third) is not type(first)
+        assert (lloyd_dir / "runs.txt").read_text() == "xx"
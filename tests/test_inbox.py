@@ -0,0 +1,189 @@
+"""Tests for InboxStore."""
+
+import json
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from lloyd.inbox import InboxItem, InboxStore
+
+
+def add_and_resolve(lloyd_dir: Path, prefix: str, count: int) -> None:
+    """Add and resolve items from a separate process."""
+    store = InboxStore(lloyd_dir)
+    for i in range(count):
+        item = store.add(InboxItem(id=f"{prefix}{i}", title=prefix))
+        store.resolve(item.id, "approve")
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> InboxStore:
+    """Create a store in a temporary directory."""
+    return InboxStore(tmp_path)
+
+
+class TestInboxStore:
+    """Tests for InboxStore persistence and caching."""
+
+    def test_add_resolve_delete(self, store: InboxStore) -> None:
+        """Mutations are persisted and visible to a fresh store."""
+        first = store.add(InboxItem(title="first"))
+        second = store.add(InboxItem(title="second", priority="high"))
+        store.resolve(first.id, "approve")
+        assert store.delete("missing") is False
+        assert store.resolve("missing", "approve") is None
+
+        fresh = InboxStore(store.lloyd_dir)
+
+        assert [i.title for i in fresh.list_all()] == ["first", "second"]
+        assert fresh.get(first.id).resolution == "approve"
+        assert [i.id for i in fresh.list_unresolved()] == [second.id]
+        assert fresh.delete(second.id) is True
+        assert [i.id for i in InboxStore(store.lloyd_dir).list_all()] == [first.id]
+
+    def test_reads_served_from_cache(
+        self, store: InboxStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Reads after a write do not reparse the file."""
+        item = store.add(InboxItem(title="cached"))
+        monkeypatch.setattr(InboxItem, "from_dict", classmethod(lambda cls, d: pytest.fail()))
+
+        assert store.get(item.id) is item
+        assert store.list_unresolved() == [item]
+
+    def test_unresolved_index_follows_mutations(self, store: InboxStore) -> None:
+        """The unresolved list tracks adds, resolves, re-adds and deletes in order."""
+        a, b, c = (store.add(InboxItem(title=t)) for t in "abc")
+        store.resolve(a.id, "approve")
+        store.delete(c.id)
+        assert store.list_unresolved() == [b]
+
+        store.add(InboxItem(id=a.id, title="reopened"))
+        b.resolve("approve")  # Resolved outside the store
+
+        assert [i.title for i in store.list_unresolved()] == ["reopened"]
+
+    def test_external_write_reloads(self, store: InboxStore) -> None:
+        """Changes made by another store instance are picked up."""
+        store.add(InboxItem(title="mine"))
+        InboxStore(store.lloyd_dir).add(InboxItem(title="theirs"))
+
+        assert [i.title for i in store.list_all()] == ["mine", "theirs"]
+
+    def test_partial_last_line_ignored(self, store: InboxStore) -> None:
+        """An unfinished append is skipped on read and dropped by the next write."""
+        kept = store.add(InboxItem(title="kept"))
+        with open(store.inbox_file, "ab") as f:
+            f.write(b'{"id": "c", "ti')
+
+        fresh = InboxStore(store.lloyd_dir)
+        assert fresh.list_all() == [kept]
+
+        fresh.add(InboxItem(title="next"))
+
+        assert [i.title for i in InboxStore(store.lloyd_dir).list_all()] == ["kept", "next"]
+        assert store.inbox_file.read_bytes().endswith(b"\n")
+
+    def test_concurrent_processes_keep_all_items(self, store: InboxStore) -> None:
+        """Appends and compactions from separate processes never drop items."""
+        ctx = multiprocessing.get_context("spawn")
+        procs = [
+            ctx.Process(target=add_and_resolve, args=(store.lloyd_dir, prefix, 20))
+            for prefix in ("p", "q", "r")
+        ]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+
+        items = store.list_all()
+        assert len(items) == 60
+        assert all(item.resolution == "approve" for item in items)
+
+    def test_add_appends_to_log(self, store: InboxStore) -> None:
+        """Adding items appends one line each instead of rewriting the log."""
+        for i in range(5):
+            store.add(InboxItem(title=str(i)))
+        size = store.inbox_file.stat().st_size
+
+        store.add(InboxItem(title="last"))
+
+        with open(store.inbox_file, "rb") as f:
+            f.seek(size)
+            assert json.loads(f.read())["title"] == "last"
+        assert len(store.inbox_file.read_text().splitlines()) == 6
+
+    def test_log_compacted_when_mostly_stale(self, store: InboxStore) -> None:
+        """Superseded records and tombstones are compacted away."""
+        items = [store.add(InboxItem(title=str(i))) for i in range(10)]
+        for item in items[:3]:
+            store.resolve(item.id, "done")
+        assert len(store.inbox_file.read_text().splitlines()) == 13
+
+        store.delete(items[9].id)
+
+        assert len(store.inbox_file.read_text().splitlines()) == 9
+        assert len(InboxStore(store.lloyd_dir).list_unresolved()) == 6
+
+    def test_legacy_items_json_migrated(self, store: InboxStore) -> None:
+        """Items from the old JSON array file are read and moved to the log."""
+        old = InboxItem(title="old")
+        store.legacy_file.parent.mkdir(parents=True)
+        store.legacy_file.write_text(json.dumps([old.to_dict()]))
+
+        assert [i.title for i in store.list_all()] == ["old"]
+        store.add(InboxItem(title="new"))
+
+        assert not store.legacy_file.exists()
+        assert [i.title for i in InboxStore(store.lloyd_dir).list_all()] == ["old", "new"]
+
+
+class TestInboxItem:
+    """Tests for InboxItem serialization."""
+
+    def test_round_trip(self) -> None:
+        """to_dict and from_dict preserve every field."""
+        item = InboxItem(type="question", title="Which DB?", context={"a": 1}, actions=["x"])
+        item.resolve("x")
+
+        assert InboxItem.from_dict(item.to_dict()) == item
+
+    def test_log_records_match_to_dict(self, tmp_path: Path) -> None:
+        """Log lines written from the dataclass decode to the item's to_dict."""
+        store = InboxStore(tmp_path)
+        item = InboxItem(title="logged", context={"story": "s1"})
+        item.resolve("approve")
+        store.add(item)
+
+        (line,) = store.inbox_file.read_text().splitlines()
+        assert json.loads(line) == item.to_dict()
+
+    def test_from_dict_defaults(self) -> None:
+        """Optional fields fall back to their defaults."""
+        item = InboxItem.from_dict({"id": "abc", "created_at": "2026-01-01T00:00:00"})
+
+        assert (item.type, item.priority, item.resolved_at) == ("review", "normal", None)
+        assert not hasattr(item, "__dict__")
+
+    def test_from_dict_interns_categorical_fields(self) -> None:
+        """Items loaded from separate records share their repeated strings."""
+        record = {"id": "a", "created_at": "2026-01-01T00:00:00"}
+        items = [
+            InboxItem.from_dict({**record, "project_id": "".join(["proj", "-1"])}) for _ in range(2)
+        ]
+
+        assert items[0].project_id is items[1].project_id
+
+    def test_default_id_is_eight_hex_chars(self) -> None:
+        """Generated IDs keep the short 8-character hex format."""
+        item = InboxItem()
+
+        assert len(item.id) == 8
+        assert int(item.id, 16) >= 0
+
+    def test_from_dict_keeps_legacy_nulls(self) -> None:
+        """Null categorical fields in old records load instead of failing to intern."""
+        record = {"id": "a", "created_at": "2026-01-01T00:00:00", "project_id": None}
+
+        assert InboxItem.from_dict(record).project_id is None
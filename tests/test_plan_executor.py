@@ -0,0 +1,95 @@
+"""Tests for the dependency-graph plan executor."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from lloyd.orchestrator.plan_executor import Node, PlanExecutor
+
+
+class FakeAgent:
+    """Agent stand-in that records calls and echoes its task."""
+
+    def __init__(self, name: str, delay: float = 0.0, log: list[str] | None = None) -> None:
+        self.name = name
+        self.delay = delay
+        self.log = log if log is not None else []
+        self.tasks: list[str] = []
+
+    async def execute_async(
+        self, task_description: str, context: Any = None, timeout: float | None = None
+    ) -> str:
+        self.log.append(f"start:{self.name}")
+        self.tasks.append(task_description)
+        await asyncio.sleep(self.delay)
+        self.log.append(f"end:{self.name}")
+        return f"{self.name}-result"
+
+
+class TestPlanExecutor:
+    """Tests for PlanExecutor scheduling."""
+
+    def test_independent_nodes_run_concurrently(self) -> None:
+        """Nodes without dependencies start before any of them finishes."""
+        log: list[str] = []
+        nodes = [
+            Node("research", FakeAgent("research", 0.01, log), "Research"),
+            Node("analyze", FakeAgent("analyze", 0.01, log), "Analyze"),
+        ]
+
+        state = asyncio.run(PlanExecutor(nodes).run())
+
+        assert log[:2] == ["start:research", "start:analyze"] or log[:2] == [
+            "start:analyze",
+            "start:research",
+        ]
+        assert state == {"research": "research-result", "analyze": "analyze-result"}
+
+    def test_dependent_node_waits_and_sees_results(self) -> None:
+        """A node starts only after its deps and gets their results rendered in."""
+        log: list[str] = []
+        architect = FakeAgent("architect", log=log)
+        nodes = [
+            Node("research", FakeAgent("research", 0.01, log), "Research"),
+            Node("design", architect, "Design using {research}", deps=["research"]),
+        ]
+
+        asyncio.run(PlanExecutor(nodes).run())
+
+        assert log.index("end:research") < log.index("start:architect")
+        assert architect.tasks == ["Design using research-result"]
+
+    def test_custom_state_updater(self) -> None:
+        """The aggregation callback controls the state passed downstream."""
+
+        def collect(state: dict[str, Any], node: Node, result: str) -> dict[str, Any]:
+            state.setdefault("observations", []).append(result)
+            return state
+
+        nodes = [
+            Node("a", FakeAgent("a"), "A"),
+            Node("b", FakeAgent("b"), "B", deps=["a"]),
+        ]
+
+        state = asyncio.run(PlanExecutor(nodes, update_state=collect).run())
+
+        assert state["observations"] == ["a-result", "b-result"]
+
+    def test_unknown_dependency_rejected(self) -> None:
+        """Dependencies on nodes outside the plan are rejected."""
+        with pytest.raises(ValueError, match="unknown node"):
+            PlanExecutor([Node("a", FakeAgent("a"), "A", deps=["missing"])])
+
+    def test_cycle_rejected(self) -> None:
+        """Cyclic plans are rejected."""
+        nodes = [
+            Node("a", FakeAgent("a"), "A", deps=["b"]),
+            Node("b", FakeAgent("b"), "B", deps=["a"]),
+        ]
+        with pytest.raises(ValueError, match="cycle"):
+            PlanExecutor(nodes)
+
+    def test_render_keeps_unknown_placeholders(self) -> None:
+        """Placeholders without a result are left untouched."""
+        assert PlanExecutor.render("Use {x} and {y}", {"x": "1"}) == "Use 1 and {y}"
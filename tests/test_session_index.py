@@ -0,0 +1,94 @@
+"""Tests for the process-safe session index."""
+
+import multiprocessing
+from pathlib import Path
+from typing import Any
+
+import orjson
+import pytest
+
+from lloyd.utils.session_index import SessionIndex
+
+
+def status_entry(data: dict[str, Any]) -> str:
+    """Index a session by its status."""
+    return str(data["status"])
+
+
+def save(index: SessionIndex, session_id: str, status: str = "open") -> None:
+    """Write a session file and record it in the index."""
+    data = {"session_id": session_id, "status": status}
+    (index.directory / f"{session_id}.json").write_bytes(orjson.dumps(data))
+    index.update(session_id, data)
+
+
+def save_many(directory: Path, prefix: str, count: int) -> None:
+    """Save sessions from a separate process."""
+    index = SessionIndex(directory, status_entry)
+    for i in range(count):
+        save(index, f"{prefix}{i}")
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> SessionIndex:
+    """Create an index over a temporary directory."""
+    return SessionIndex(tmp_path, status_entry)
+
+
+class TestSessionIndex:
+    """Tests for SessionIndex."""
+
+    def test_update_and_delete(self, index: SessionIndex) -> None:
+        """Updates and tombstones are visible to a fresh index."""
+        save(index, "a")
+        save(index, "b")
+        save(index, "a", "done")
+        index.update("b", None)
+
+        assert SessionIndex(index.directory, status_entry).load() == {"a": "done"}
+
+    def test_reads_do_not_write(self, index: SessionIndex) -> None:
+        """Without a log, entries come from the session files and nothing is written."""
+        (index.directory / "a.json").write_bytes(b'{"session_id": "a", "status": "open"}')
+
+        assert index.load() == {"a": "open"}
+        assert sorted(p.name for p in index.directory.iterdir()) == ["a.json"]
+
+    def test_unchanged_entry_not_appended(self, index: SessionIndex) -> None:
+        """Saving a session whose entry is unchanged leaves the log alone."""
+        save(index, "a")
+        size = index.path.stat().st_size
+
+        save(index, "a")
+
+        assert index.path.stat().st_size == size
+
+    def test_log_compacted(self, index: SessionIndex) -> None:
+        """Superseded lines are dropped once they outnumber the live entries."""
+        for status in ("1", "2", "3", "4", "5"):
+            save(index, "a", status)
+
+        assert len(index.path.read_bytes().splitlines()) <= 2
+        assert SessionIndex(index.directory, status_entry).load() == {"a": "5"}
+
+    def test_unterminated_line_ignored(self, index: SessionIndex) -> None:
+        """A partially appended last line is skipped until it is complete."""
+        save(index, "a")
+        with open(index.path, "ab") as f:
+            f.write(b'{"id": "b", "ent')
+
+        assert SessionIndex(index.directory, status_entry).load() == {"a": "open"}
+
+    def test_concurrent_processes_keep_every_update(self, index: SessionIndex) -> None:
+        """Writers in separate processes never drop each other's entries."""
+        ctx = multiprocessing.get_context("spawn")
+        procs = [
+            ctx.Process(target=save_many, args=(index.directory, prefix, 20))
+            for prefix in ("p", "q", "r")
+        ]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+
+        assert len(index.load()) == 60
@@ -3,6 +3,8 @@
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from lloyd.tools.filesystem import (
     create_directory,
     delete_file,
@@ -78,3 +80,32 @@ def test_delete_file() -> None:
 
     assert "Successfully" in result
     assert not Path(temp_path).exists()
+
+
+def test_get_tools_by_names_shares_instances() -> None:
+    """Test that repeated lookups return the same tool instances."""
+    from lloyd.tools import get_tools_by_names
+
+    first = get_tools_by_names(["file_read", "file_write"])
+    second = get_tools_by_names(["file_read", "file_write"])
+
+    assert first == [read_file, write_file]
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second, strict=True))
+
+
+def test_github_fallback_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that GitHub tools are looked up again until Composio provides them."""
+    from lloyd import tools
+    from lloyd.tools import github
+
+    monkeypatch.setattr(tools, "_tools_cache", {})
+    monkeypatch.setattr(github, "_get_composio_tools", list)
+    assert tools.get_tools_by_names(["github"]) == github.GITHUB_TOOLS
+
+    composio_tool = object()
+    monkeypatch.setattr(github, "_get_composio_tools", lambda: [composio_tool])
+    assert tools.get_tools_by_names(["github"]) == [composio_tool]
+
+    monkeypatch.setattr(github, "_get_composio_tools", lambda: pytest.fail())
+    assert tools.get_tools_by_names(["github"]) == [composio_tool]